@@ -9,13 +9,12 @@ from typing import Tuple, List, Dict, Any
 from chatbot.twilio.handlers import handle_incoming_message, initialize_conversation
 from flask import Flask, request, jsonify, redirect, url_for, Response, send_from_directory
 from calendar_module.auth import authenticate, oauth2callback
-from calendar_module.calendar_service import CalendarService
 from dotenv import load_dotenv
 from twilio.request_validator import RequestValidator
 import pytz
 from werkzeug.middleware.proxy_fix import ProxyFix
 import threading
-from pymongo import MongoClient
+from store.mongodb_handler import get_client
 from calendar_module.auth import load_credentials
 import uuid  # Added for UUID generation
 from flask_cors import CORS
@@ -393,8 +392,7 @@ def api_create_event_endpoint(conversation_id: str) -> Tuple[Response, int]:
         return jsonify({"error": "Missing interviewee_number in request body"}), 400
 
     try:
-        calendar_service = CalendarService()
-        event_response, error = calendar_service.create_event(conversation_id, interviewee_number)
+        event_response, error = scheduler.calendar_service.create_event(conversation_id, interviewee_number)
         
         if error:
             if error in ["No tokens found for the given conversation ID. Please authenticate.", "invalid_grant"]:
@@ -434,7 +432,7 @@ def auth_schedule(conversation_id: str) -> Response:
 def get_active_conversations():
     logger.info("Received request for active conversations")
     try:
-        all_conversations = scheduler.mongodb_handler.get_all_conversations()
+        all_conversations = scheduler.mongodb_handler.iter_conversations()
         active_conversations = []
 
         for conversation in all_conversations:
@@ -477,7 +475,7 @@ def get_active_conversations():
 @require_api_key
 def get_scheduled_interviews():
     try:
-        all_conversations = scheduler.mongodb_handler.get_all_conversations()
+        all_conversations = scheduler.mongodb_handler.iter_conversations()
         scheduled_interviews = []
 
         for conversation in all_conversations:
@@ -510,7 +508,7 @@ def get_scheduled_interviews():
 def get_completed_conversations():
     logger.info("Received request for completed conversations")
     try:
-        all_conversations = scheduler.mongodb_handler.get_all_conversations()
+        all_conversations = scheduler.mongodb_handler.iter_conversations()
         completed_conversations = []
 
         for conversation in all_conversations:
@@ -604,9 +602,8 @@ def delete_conversation(conversation_id: str):
 def health_check() -> Tuple[Response, int]:
     try:
         MONGODB_URI = os.getenv("MONGODB_URI")
-        client = MongoClient(MONGODB_URI)
+        client = get_client(MONGODB_URI)
         client.admin.command('ping')  
-        client.close()
 
         return jsonify({
             "status": "healthy",
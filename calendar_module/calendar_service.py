@@ -4,13 +4,14 @@ from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from calendar_module.auth import load_credentials
 from datetime import datetime
-import pytz
 import logging
 import os
 from dotenv import load_dotenv
-from pymongo import MongoClient
+from store.mongodb_handler import MongoDBHandler
+from chatbot.timezones import get_timezone
 import time
-from typing import Tuple, Optional, Dict, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Tuple, Optional, Dict, Any, Callable
 
 load_dotenv()
 
@@ -21,11 +22,18 @@ logger = logging.getLogger(__name__)
 MONGODB_URI = os.getenv("MONGODB_URI")
 DB_NAME = os.getenv("MONGODB_DB_NAME")
 
-client = MongoClient(MONGODB_URI)
-db = client[DB_NAME]
-conversations_collection = db.conversations
+# Background workers for calendar writes that do not need to block the caller
+_calendar_pool = ThreadPoolExecutor(max_workers=4)
 
 class CalendarService:
+    def __init__(self, mongodb_handler: Optional[MongoDBHandler] = None):
+        """
+        Conversations are read and event ids written back through mongodb_handler. Pass the
+        scheduler's handler so its conversation cache is invalidated by those writes; a
+        handler of its own is opened otherwise.
+        """
+        self.mongodb_handler = mongodb_handler or MongoDBHandler(MONGODB_URI, DB_NAME)
+
     def create_event(self, conversation_id: str, interviewee_number: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
         """
         Creates a Google Calendar event for a specific interviewee.
@@ -44,7 +52,7 @@ class CalendarService:
                 return None, "Missing required parameters"
 
             # Retrieve conversation from MongoDB
-            conversation = conversations_collection.find_one({'conversation_id': conversation_id})
+            conversation = self.mongodb_handler.get_conversation(conversation_id)
             if not conversation:
                 logger.error(f"Conversation {conversation_id} not found.")
                 return None, f"Conversation {conversation_id} not found"
@@ -80,20 +88,12 @@ class CalendarService:
                 logger.error(f"Invalid datetime format: {e}")
                 return None, "Invalid datetime format"
 
-            # Get timezone, defaulting to UTC if not specified
-            time_zone = interviewer.get('timezone', 'UTC')
-            try:
-                tz = pytz.timezone(time_zone)
-                start_datetime_local = meeting_start.astimezone(tz)
-                end_datetime_local = meeting_end.astimezone(tz)
-            except pytz.exceptions.UnknownTimeZoneError:
-                logger.error(f"Unknown timezone: {time_zone}")
-                # Fall back to UTC
-                time_zone = 'UTC'
-                tz = pytz.UTC
-                start_datetime_local = meeting_start.astimezone(tz)
-                end_datetime_local = meeting_end.astimezone(tz)
-                logger.info(f"Falling back to UTC timezone for conversation {conversation_id}")
+            # Get timezone, defaulting to UTC if not specified. get_timezone also falls back to
+            # UTC for unknown names, so the event takes the zone name from what it returned
+            tz = get_timezone(interviewer.get('timezone', 'UTC'))
+            time_zone = tz.zone
+            start_datetime_local = meeting_start.astimezone(tz)
+            end_datetime_local = meeting_end.astimezone(tz)
 
             # Prepare event details
             event = {
@@ -137,20 +137,12 @@ class CalendarService:
                 return None, "Failed to create calendar event"
 
             # Update MongoDB with event ID
-            update_result = conversations_collection.update_one(
-                {
-                    'conversation_id': conversation_id,
-                    'interviewees.number': interviewee_number
-                },
-                {
-                    '$set': {
-                        'interviewees.$.event_id': event_result.get('id'),
-                        'interviewees.$.calendar_link': event_result.get('htmlLink')
-                    }
-                }
-            )
+            updated = self.mongodb_handler.update_interviewee(conversation_id, interviewee_number, {
+                'event_id': event_result.get('id'),
+                'calendar_link': event_result.get('htmlLink')
+            })
 
-            if update_result.modified_count == 0:
+            if not updated:
                 logger.warning("Failed to update conversation with event ID")
 
             logger.info(f"Event created successfully: {event_result.get('htmlLink')}")
@@ -207,6 +199,35 @@ class CalendarService:
                 time.sleep(current_delay)
                 current_delay = min(current_delay * 2, 30)  # Exponential backoff
 
+    def delete_event_async(self, event_id: str, on_failure: Optional[Callable[[str], None]] = None) -> Future:
+        """
+        Deletes an event from Google Calendar in the background, with the same retry logic as delete_event.
+
+        Args:
+            event_id (str): The ID of the event to delete.
+            on_failure (Optional[Callable[[str], None]]): Called with the event ID if the deletion
+                ultimately fails, so the caller can compensate for having assumed success.
+
+        Returns:
+            Future: Resolves to True if deletion was successful, False otherwise.
+        """
+        future = _calendar_pool.submit(self.delete_event, event_id)
+
+        def _check_result(done: Future):
+            try:
+                deleted = done.result()
+            except Exception as e:
+                logger.error(f"Background deletion of event {event_id} raised: {e}")
+                deleted = False
+            if not deleted and on_failure:
+                try:
+                    on_failure(event_id)
+                except Exception as e:
+                    logger.error(f"Error compensating failed deletion of event {event_id}: {e}")
+
+        future.add_done_callback(_check_result)
+        return future
+
     def update_event(self, conversation_id: str, event_id: str, new_start_time: str, new_end_time: str) -> bool:
         """
         Update the event's start and end time on the calendar.
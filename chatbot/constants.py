@@ -24,3 +24,6 @@ class ConversationState(Enum):
     AWAITING_MORE_SLOTS_FROM_INTERVIEWER = 'awaiting_more_slots_from_interviewer'
     SCHEDULING = "scheduling"
     AWAITING_RESPONSE = "awaiting_response"
+
+# State values in which an interviewee needs no further scheduling
+FINAL_STATES = frozenset({ConversationState.SCHEDULED.value, ConversationState.CANCELLED.value})
@@ -11,13 +11,14 @@ from typing import Optional, Dict, Any, List
 from .attention import AttentionFlagManager
 from .schedule_api import ScheduleAPI
 from .message_handler import MessageHandler
-from chatbot.utils import normalize_number, get_localized_current_time, extract_timezone_from_number
-from chatbot.constants import ConversationState, AttentionFlag
+from chatbot.utils import normalize_number, get_localized_current_time, extract_timezone_from_number, LOCAL_TIME_FORMAT
+from chatbot.timezones import get_timezone
+from chatbot.constants import ConversationState, AttentionFlag, FINAL_STATES
 from dotenv import load_dotenv
 from store.mongodb_handler import MongoDBHandler
 from calendar_module.calendar_service import CalendarService
-from chatbot.schedule_api import ScheduleAPI
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 load_dotenv()
 
@@ -26,6 +27,10 @@ your_db_name = os.getenv("MONGODB_DB_NAME")
 
 logger = logging.getLogger(__name__)
 
+# Runs the per-participant timezone lookups. Kept apart from message_handler's pool, which
+# the lookups themselves submit sends to, so a full pool cannot wait on its own tasks
+_timezone_pool = ThreadPoolExecutor(max_workers=4)
+
 class AttentionFlagEvaluator:
     RESPONSE_THRESHOLD = timedelta(hours=24)
 
@@ -68,27 +73,44 @@ class AttentionFlagHandler:
         self.scheduler = scheduler
 
     def handle_flags_for_conversation(self, conversation_id, flags_dict):
+        flag_entries = self.collect_flag_entries(conversation_id, flags_dict)
+        if flag_entries:
+            self.store_flag_entries(flag_entries)
+
+    def collect_flag_entries(self, conversation_id: str, flags_dict) -> List[Dict[str, Any]]:
+        """
+        Builds the attention flag documents for a conversation's evaluated flags, without
+        storing them, so a sweep over many conversations can insert them in one write.
+        """
         all_flags = set()
         for fset in flags_dict.values():
             all_flags.update(fset)
+        return self.build_flag_entries(conversation_id, all_flags)
 
-        if all_flags:
-            self.store_attention_flags(conversation_id, all_flags)
-
-    def store_attention_flags(self, conversation_id: str, flags: set):
-        for flag in flags:
-            flag_id = str(uuid.uuid4())
-            flag_entry = {
-                'id': flag_id,
+    def build_flag_entries(self, conversation_id: str, flags: set) -> List[Dict[str, Any]]:
+        created_at = datetime.now(pytz.UTC).isoformat()
+        return [
+            {
+                'id': str(uuid.uuid4()),
                 'conversation_id': conversation_id,
                 'flag_type': flag.value,
                 'message': self.generate_flag_message(flag),
                 'severity': 'high',
-                'created_at': datetime.now(pytz.UTC).isoformat(),
+                'created_at': created_at,
                 'resolved': False
             }
-            self.scheduler.mongodb_handler.create_attention_flag(flag_entry)
-            logger.info(f"Stored attention flag {flag_id} for conversation {conversation_id}.")
+            for flag in flags
+        ]
+
+    def store_flag_entries(self, flag_entries: List[Dict[str, Any]]):
+        self.scheduler.mongodb_handler.create_attention_flags(flag_entries)
+        for flag_entry in flag_entries:
+            logger.info(f"Stored attention flag {flag_entry['id']} for conversation {flag_entry['conversation_id']}.")
+
+    def store_attention_flags(self, conversation_id: str, flags: set):
+        flag_entries = self.build_flag_entries(conversation_id, flags)
+        if flag_entries:
+            self.store_flag_entries(flag_entries)
 
     def generate_flag_message(self, flag: AttentionFlag) -> str:
         if flag == AttentionFlag.NO_RESPONSE:
@@ -107,8 +129,7 @@ class InterviewScheduler:
         self.api_handler = ScheduleAPI()
         self.message_handler = MessageHandler(self)
         self.mongodb_handler = MongoDBHandler(your_mongodb_uri, your_db_name)
-        self.calendar_service = CalendarService()
-        self.schedule_api = ScheduleAPI()
+        self.calendar_service = CalendarService(self.mongodb_handler)
 
         self.evaluator = AttentionFlagEvaluator()
         self.flag_handler = AttentionFlagHandler(self)
@@ -121,13 +142,18 @@ class InterviewScheduler:
 
     def check_attention_flags(self):
         current_time = datetime.now(pytz.UTC)
-        conversations = self.mongodb_handler.get_all_conversations()
+        conversations = self.mongodb_handler.iter_conversations()
 
+        # Flags raised across the sweep are inserted together in one write
+        flag_entries = []
         for conversation in conversations:
             conversation_id = conversation['conversation_id']
             flags_dict = self.evaluator.evaluate_conversation_flags(conversation, current_time)
             if flags_dict:
-                self.flag_handler.handle_flags_for_conversation(conversation_id, flags_dict)
+                flag_entries.extend(self.flag_handler.collect_flag_entries(conversation_id, flags_dict))
+
+        if flag_entries:
+            self.flag_handler.store_flag_entries(flag_entries)
 
     def setup_conversation_logger(self):
         self.conversation_logger = logging.getLogger('conversation_history')
@@ -140,7 +166,7 @@ class InterviewScheduler:
 
     def log_conversation_history(self, conversation_id: str):
         try:
-            conversation = self.mongodb_handler.get_conversation(conversation_id)
+            conversation = self.mongodb_handler.get_conversation(conversation_id, cached=True)
             if not conversation:
                 logger.error(f"Conversation {conversation_id} not found for logging history.")
                 return
@@ -434,35 +460,29 @@ class InterviewScheduler:
                 interviewee['scheduled_slot'] = interviewee['proposed_slot']
                 interviewee['state'] = ConversationState.SCHEDULED.value
 
-                # Remove the scheduled slot from available_slots if it exists
+                # Remove the scheduled slot from available_slots if it exists, in the same write
+                update_data = {}
                 if interviewee['proposed_slot'] in conversation['available_slots']:
                     conversation['available_slots'].remove(interviewee['proposed_slot'])
-                    self.mongodb_handler.update_conversation(conversation_id, {
-                        'available_slots': conversation['available_slots']
-                    })
+                    update_data['available_slots'] = conversation['available_slots']
 
-                self.mongodb_handler.update_conversation(conversation_id, {
-                    'interviewees': conversation['interviewees']
-                })
+                self.mongodb_handler.update_interviewee(conversation_id, interviewee_number, {
+                    'scheduled_slot': interviewee['scheduled_slot'],
+                    'state': interviewee['state']
+                }, update_data=update_data)
 
                 # Only notify the interviewee that the slot is now scheduled
                 participant = interviewee
                 try:
                     participant_timezone = participant.get('timezone', 'UTC')
-                    try:
-                        tz = pytz.timezone(participant_timezone)
-                    except pytz.exceptions.UnknownTimeZoneError:
-                        logger.warning(f"Invalid timezone {participant_timezone}, defaulting to UTC")
-                        tz = pytz.UTC
-
-                    localized_meeting_time = meeting_time_utc.astimezone(tz)
+                    localized_meeting_time = meeting_time_utc.astimezone(get_timezone(participant_timezone))
                     # Localized current time for the interviewee
                     local_now = get_localized_current_time(participant_timezone)
 
                     # --- Third-person perspective system message ---
                     system_message = (
                         f"Instruct the AI assistant to inform {participant['name']} that their meeting "
-                        f"has been scheduled for {localized_meeting_time.strftime('%A, %B %d, %Y at %I:%M %p %Z')}.\n\n"
+                        f"has been scheduled for {localized_meeting_time.strftime(LOCAL_TIME_FORMAT)}.\n\n"
                         f"Current Local Time: {local_now}"
                     )
 
@@ -479,20 +499,16 @@ class InterviewScheduler:
                 except Exception as e:
                     logger.error(f"Error sending confirmation to participant {participant['number']}: {str(e)}")
 
-                # Reset
+                # Reset, and add the scheduled slot to scheduled_slots in the same write
                 interviewee['confirmed'] = False
                 interviewee['proposed_slot'] = None
-                self.mongodb_handler.update_conversation(conversation_id, {
-                    'interviewees': conversation['interviewees']
-                })
-
-                # Add the scheduled slot to scheduled_slots
                 if 'scheduled_slots' not in conversation:
                     conversation['scheduled_slots'] = []
                 conversation['scheduled_slots'].append(interviewee['scheduled_slot'])
-                self.mongodb_handler.update_conversation(conversation_id, {
-                    'scheduled_slots': conversation['scheduled_slots']
-                })
+                self.mongodb_handler.update_interviewee(conversation_id, interviewee_number, {
+                    'confirmed': False,
+                    'proposed_slot': None
+                }, update_data={'scheduled_slots': conversation['scheduled_slots']})
 
                 # Attempt to create Google Calendar Event
                 event_result = self.api_handler.post_to_create_event(conversation_id, interviewee_number)
@@ -503,8 +519,8 @@ class InterviewScheduler:
                         logger.error(f"Failed to retrieve event_id for conversation {conversation_id} and interviewee {interviewee_number}.")
                     else:
                         logger.info(f"event_id: {interviewee['event_id']}")
-                    self.mongodb_handler.update_conversation(conversation_id, {
-                        'interviewees': conversation['interviewees']
+                    self.mongodb_handler.update_interviewee(conversation_id, interviewee_number, {
+                        'event_id': interviewee['event_id']
                     })
                     logger.info(f"Event created for conversation {conversation_id} and interviewee {interviewee_number}.")
                 else:
@@ -529,13 +545,20 @@ class InterviewScheduler:
 
         for interviewee in conversation['interviewees']:
             if interviewee['state'] == ConversationState.AWAITING_AVAILABILITY.value:
-                self.message_handler.initiate_conversation_with_interviewee(conversation_id, interviewee['number'])
+                self.message_handler.initiate_conversation_with_interviewee(
+                    conversation_id, interviewee['number'], conversation=conversation, interviewee=interviewee
+                )
                 return
 
         logger.info(f"All interviewees have been contacted or scheduled for conversation {conversation_id}.")
-        self.complete_conversation(conversation_id)
+        self.complete_conversation(conversation_id, conversation=conversation)
 
-    def log_conversation(self, conversation_id: str, participant_id: str, message_type: str, message: str, sender: str) -> None:
+    def log_conversation(self, conversation_id: str, participant_id: str, message_type: str, message: str, sender: str,
+                         update_data: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Appends a message to the participant's conversation history. Top-level fields in
+        update_data (e.g. 'interviewer.state') are written in the same update.
+        """
         try:
             conversation = self.mongodb_handler.get_conversation(conversation_id)
             if not conversation:
@@ -558,26 +581,26 @@ class InterviewScheduler:
 
             if participant['role'] == 'interviewer':
                 self.mongodb_handler.update_conversation(conversation_id, {
-                    'interviewer.conversation_history': participant_history
+                    'interviewer.conversation_history': participant_history,
+                    **(update_data or {})
                 })
             else:
-                for i, ie in enumerate(conversation['interviewees']):
-                    if ie['number'] == participant_id:
-                        conversation['interviewees'][i]['conversation_history'] = participant_history
-                self.mongodb_handler.update_conversation(conversation_id, {
-                    'interviewees': conversation['interviewees']
-                })
+                self.mongodb_handler.update_interviewee(conversation_id, participant_id, {
+                    'conversation_history': participant_history
+                }, update_data)
 
             logger.debug(f"Logged message for participant {participant_id} in conversation {conversation_id}: {log_entry}")
         except Exception as e:
             logger.error(f"Error logging conversation: {str(e)}")
 
-    def complete_conversation(self, conversation_id: str):
+    def complete_conversation(self, conversation_id: str, conversation: Optional[Dict[str, Any]] = None):
         """
         Just before marking conversation completed, send the interviewer a
         conclusive report about who got scheduled and who did not.
+        An already-loaded conversation can be passed to avoid fetching it again.
         """
-        conversation = self.mongodb_handler.get_conversation(conversation_id)
+        if conversation is None:
+            conversation = self.mongodb_handler.get_conversation(conversation_id)
         if not conversation:
             logger.error(f"Conversation {conversation_id} not found for completion.")
             return
@@ -595,12 +618,8 @@ class InterviewScheduler:
             if state == ConversationState.SCHEDULED.value and ie.get('scheduled_slot'):
                 # Convert to interviewer's local time
                 start_utc = datetime.fromisoformat(ie['scheduled_slot']['start_time'])
-                try:
-                    tz = pytz.timezone(timezone_str)
-                except pytz.exceptions.UnknownTimeZoneError:
-                    tz = pytz.UTC
-                local_time = start_utc.astimezone(tz)
-                local_time_str = local_time.strftime('%A, %B %d, %Y at %I:%M %p %Z')
+                local_time = start_utc.astimezone(get_timezone(timezone_str))
+                local_time_str = local_time.strftime(LOCAL_TIME_FORMAT)
                 report_lines.append(f"{name} => Scheduled at {local_time_str}")
             else:
                 # Not scheduled or canceled
@@ -636,7 +655,7 @@ class InterviewScheduler:
 
     def is_conversation_complete(self, conversation: Dict[str, Any]) -> bool:
         for ie in conversation['interviewees']:
-            if ie['state'] not in [ConversationState.SCHEDULED.value, ConversationState.CANCELLED.value]:
+            if ie['state'] not in FINAL_STATES:
                 return False
         return True
 
@@ -652,7 +671,6 @@ class InterviewScheduler:
 
     def determine_timezone_for_participant(self, conversation_id: str, participant: dict) -> str:
         try:
-            conversation = self.mongodb_handler.get_conversation(conversation_id)
             timezone = extract_timezone_from_number(participant['number'])
             if timezone and timezone.lower() != 'unspecified':
                 return timezone
@@ -681,12 +699,8 @@ class InterviewScheduler:
                     'interviewer.state': ConversationState.TIMEZONE_CLARIFICATION.value
                 })
             else:
-                for i, ie in enumerate(conversation['interviewees']):
-                    if ie['number'] == participant['number']:
-                        ie['state'] = ConversationState.TIMEZONE_CLARIFICATION.value
-                        conversation['interviewees'][i] = ie
-                self.mongodb_handler.update_conversation(conversation_id, {
-                    'interviewees': conversation['interviewees']
+                self.mongodb_handler.update_interviewee(conversation_id, participant['number'], {
+                    'state': ConversationState.TIMEZONE_CLARIFICATION.value
                 })
 
             return None
@@ -703,24 +717,29 @@ class InterviewScheduler:
                 return
 
             interviewer = conversation['interviewer']
+            pending = [ie for ie in conversation['interviewees'] if not ie.get('timezone')]
             if not interviewer.get('timezone'):
-                timezone = self.determine_timezone_for_participant(conversation_id, interviewer)
-                if timezone:
-                    interviewer['timezone'] = timezone
+                pending.insert(0, interviewer)
+
+            # Each lookup may hit the LLM (and message the participant), and they are
+            # independent of each other, so run them concurrently
+            timezones = list(_timezone_pool.map(
+                lambda participant: self.determine_timezone_for_participant(conversation_id, participant),
+                pending
+            ))
+
+            for participant, timezone in zip(pending, timezones):
+                if not timezone:
+                    continue
+                participant['timezone'] = timezone
+                if participant is interviewer:
                     self.mongodb_handler.update_conversation(conversation_id, {
-                        'interviewer': interviewer
+                        'interviewer.timezone': timezone
+                    })
+                else:
+                    self.mongodb_handler.update_interviewee(conversation_id, participant['number'], {
+                        'timezone': timezone
                     })
-
-            for interviewee in conversation['interviewees']:
-                if not interviewee.get('timezone'):
-                    timezone = self.determine_timezone_for_participant(conversation_id, interviewee)
-                    if timezone:
-                        for i, ie in enumerate(conversation['interviewees']):
-                            if ie['number'] == interviewee['number']:
-                                ie['timezone'] = timezone
-                        self.mongodb_handler.update_conversation(conversation_id, {
-                            'interviewees': conversation['interviewees']
-                        })
 
         except Exception as e:
             logger.error(f"Error handling timezone determination for conversation {conversation_id}: {str(e)}")
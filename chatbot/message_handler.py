@@ -8,16 +8,20 @@ from datetime import datetime, timedelta
 import pytz
 from twilio.rest import Client
 from twilio.base.exceptions import TwilioRestException
-from chatbot.constants import ConversationState
+from chatbot.constants import ConversationState, FINAL_STATES
 from chatbot.utils import (
     extract_slots_and_timezone,
     normalize_number,
     extract_timezone_from_number,
-    get_localized_current_time
+    get_localized_current_time,
+    LOCAL_TIME_FORMAT
 )
+from chatbot.timezones import get_timezone
 from dotenv import load_dotenv
 from .llm.llmmodel import LLMModel
 import traceback
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 load_dotenv()
@@ -27,6 +31,53 @@ logger = logging.getLogger(__name__)
 # NEW: A configurable constant for how many times we may ask the interviewer for more slots
 MAX_SLOT_REQUESTS = 2  # You can make this dynamic or adjustable as needed.
 
+# Local hours [start, end) in which a proposed slot counts as convenient for the interviewee
+WORKING_HOURS = (9, 18)
+
+# Enum values compared in the scheduling loops, bound once to skip repeated attribute lookups
+_SCHEDULED = ConversationState.SCHEDULED.value
+_CANCELLED = ConversationState.CANCELLED.value
+_CONFIRMATION_PENDING = ConversationState.CONFIRMATION_PENDING.value
+_NO_SLOTS_AVAILABLE = ConversationState.NO_SLOTS_AVAILABLE.value
+_AWAITING_AVAILABILITY = ConversationState.AWAITING_AVAILABILITY.value
+
+# State sets used for membership checks, built once instead of a list literal per check
+_RETRYABLE_STATES = frozenset({_NO_SLOTS_AVAILABLE, _AWAITING_AVAILABILITY})
+_UNSCHEDULABLE_STATES = frozenset({_NO_SLOTS_AVAILABLE, _AWAITING_AVAILABILITY, _CONFIRMATION_PENDING})
+
+# Fixed participant notices, sent verbatim (generate_response with deterministic=True)
+_MSG_MEETING_CANCELLED = "The meeting between {interviewer} and {interviewee} has been cancelled."
+_MSG_CANCELLED_FOR_INTERVIEWER = "Your meeting with {name} has been cancelled as requested."
+_MSG_CANCELLED_FOR_INTERVIEWEE = "The meeting for {name} has been cancelled as requested."
+_MSG_NO_INTERVIEWEE_NAMED = "No interviewee named '{name}' was found. Please check the name and try again."
+_MSG_NOTHING_TO_CANCEL = "No scheduled meeting was found for {name}, so there is nothing to cancel."
+_MSG_ASK_NAME_TO_CANCEL_INTERVIEWER = "Please provide the name of the interviewee whose meeting you wish to cancel."
+_MSG_ASK_NAME_TO_CANCEL_INTERVIEWEE = "Please provide the name of the interviewee whose interview you wish to cancel."
+_MSG_CANCELLATION_FAILED = (
+    "The meeting between {interviewer} and {interviewee} could not be cancelled due to an internal error "
+    "and is still scheduled."
+)
+_MSG_NOTHING_TO_RESCHEDULE = "No scheduled meeting was found to reschedule."
+_MSG_NOTHING_TO_RESCHEDULE_FOR = "No scheduled meeting was found for {name}, so there is nothing to reschedule."
+_MSG_RESCHEDULING = (
+    "Your meeting with {name} is being rescheduled. "
+    "We'll offer {name} another of your available slots and confirm once it's booked."
+)
+_MSG_RESCHEDULE_FAILED = "The meeting could not be rescheduled due to an internal error. Please try again later."
+_MSG_ASK_NAME_TO_RESCHEDULE = (
+    "Multiple interviews are currently scheduled. "
+    "Please provide the name of the interviewee whose meeting you wish to reschedule."
+)
+_MSG_TIMEZONE_SET = "Thanks, {name}! Your timezone has been set to {timezone}. Please share your availability for scheduling."
+_MSG_CONVERSATION_COMPLETED = "All scheduling steps have been completed. {note} Thank you for your cooperation!"
+
+# Shared worker pool for network-bound side effects (LLM calls, WhatsApp sends)
+_io_pool = ThreadPoolExecutor(max_workers=8)
+
+# Fields needed to pick the conversation an inbound number belongs to; the full document
+# (with every participant's history) is then read only for the chosen conversation
+_CANDIDATE_PROJECTION = {'_id': 0, 'conversation_id': 1, 'status': 1, 'created_at': 1, 'interviewer.number': 1}
+
 class MessageHandler:
     def __init__(self, scheduler):
         self.scheduler = scheduler
@@ -125,13 +176,19 @@ class MessageHandler:
         user_message: str,
         system_message: str,
         conversation_state: Optional[str] = None,
-        message_type: str = 'generate_message'
+        message_type: str = 'generate_message',
+        deterministic: bool = False
     ) -> str:
         """
         Generates a response using an LLM model. 
         This function packages up the participant's context and uses either
         generate_message or answer_query from the LLMModel depending on message_type.
+        With deterministic=True the system_message is already the final text and is
+        returned as-is, skipping the LLM round trip.
         """
+        if deterministic:
+            return system_message
+
         conversation_state = conversation_state or participant.get('state')
         conversation_history = " ".join(participant.get('conversation_history', []))
         if other_participant:
@@ -168,6 +225,39 @@ class MessageHandler:
             logger.error(traceback.format_exc())
             return "The AI assistant encountered an error while processing the request."
 
+    @staticmethod
+    def _get_interviewee(conversation: dict, number: str) -> Optional[dict]:
+        """
+        Returns the conversation's interviewee with the given number, or None.
+
+        The number -> position map is cached on the conversation dict under '_number_index',
+        so a conversation handed from one handler to the next is only scanned once. It is
+        rebuilt if it no longer matches the list. Handlers only write individual fields
+        back to Mongo, so the key is never persisted.
+        """
+        interviewees = conversation.get('interviewees', [])
+        index = conversation.get('_number_index') or {}
+        position = index.get(number)
+        if position is None or position >= len(interviewees) or interviewees[position]['number'] != number:
+            index = {ie['number']: i for i, ie in enumerate(interviewees)}
+            conversation['_number_index'] = index
+            position = index.get(number)
+        return interviewees[position] if position is not None else None
+
+    def _send_system(self, conversation_id: str, participant: dict, system_message: str,
+                     user_message: str = "", deterministic: bool = False,
+                     update_data: Optional[dict] = None) -> str:
+        """
+        Generates the response for a system message, logs it to the participant's history
+        and sends it to them. Returns the response text. update_data is written together
+        with the logged message.
+        """
+        response = self.generate_response(participant, None, user_message, system_message, deterministic=deterministic)
+        participant_id = 'interviewer' if participant.get('role') == 'interviewer' else participant['number']
+        self.scheduler.log_conversation(conversation_id, participant_id, "system", response, "AI", update_data=update_data)
+        self.send_message(participant['number'], response)
+        return response
+
     def receive_message(self, from_number: str, message: str):
         """
         Main entry point for handling an incoming message from a participant. 
@@ -175,14 +265,12 @@ class MessageHandler:
         avoiding repeated messages once scheduling is done.
         """
         # Identify which conversation and participant this message is about
-        conversation_id, participant, interviewer_number = self.find_conversation_and_participant(from_number, message)
-        if not conversation_id or not participant:
+        conversation_id, participant, interviewer_number, conversation = self.find_conversation_and_participant(from_number, message)
+        if not conversation_id:
             logger.warning(f"No active conversation found for number: {from_number}")
             # Optional: create a general attention flag if you'd like to track missing conversation cases
             return
 
-        # Pull the conversation from storage
-        conversation = self.scheduler.mongodb_handler.get_conversation(conversation_id)
         if not conversation:
             logger.warning(f"Conversation {conversation_id} not found or previously removed.")
             # If you want to track it:
@@ -192,6 +280,10 @@ class MessageHandler:
                 description=f"Conversation {conversation_id} not found in DB or removed unexpectedly."
             )
             return
+
+        if not participant:
+            logger.warning(f"No active conversation found for number: {from_number}")
+            return
         
         # --- NEW: Check if the conversation is already completed ---
         if conversation.get('status') == 'completed':
@@ -232,10 +324,12 @@ class MessageHandler:
             self.handle_query(conversation_id, participant, message)
 
         elif "RESCHEDULE_REQUESTED" in intent:
+            # Logging the message above left the interviewees' states and event ids untouched,
+            # which is all the reschedule handlers read from this copy
             if participant.get('role') == 'interviewer':
-                self.handle_reschedule_request_interviewer(conversation_id, participant, message)
+                self.handle_reschedule_request_interviewer(conversation_id, participant, message, conversation=conversation)
             else:
-                self.handle_reschedule_request_interviewee(conversation_id, participant, message)
+                self.handle_reschedule_request_interviewee(conversation_id, participant, message, conversation=conversation)
 
         else:
             # Default handling: message from interviewer or interviewee
@@ -248,43 +342,41 @@ class MessageHandler:
         """
         Look up the conversation and participant based on the phone number. 
         Prefers active conversations, then queued, ignoring completed ones.
+        Candidates are fetched with only the fields needed to choose between them;
+        the chosen conversation is then loaded in full and returned as well.
         """
         from_number_norm = normalize_number(from_number)
-        conversations = self.scheduler.mongodb_handler.find_conversations_by_number(from_number_norm)
+        candidates = self.scheduler.mongodb_handler.find_conversations_by_number(
+            from_number_norm, projection=_CANDIDATE_PROJECTION
+        )
 
-        if not conversations:
-            return None, None, None
+        if not candidates:
+            return None, None, None, None
 
-        if len(conversations) == 1:
-            conversation = conversations[0]
-            participant = (
-                conversation['interviewer'] 
-                if conversation['interviewer']['number'] == from_number_norm
-                else next((ie for ie in conversation['interviewees'] if ie['number'] == from_number_norm), None)
-            )
-            return conversation['conversation_id'], participant, conversation['interviewer']['number']
-
-        active_conversations = [c for c in conversations if c['status'] == 'active']
-        if active_conversations:
-            conversation = sorted(active_conversations, key=lambda x: x['created_at'], reverse=True)[0]
-            participant = (
-                conversation['interviewer'] 
-                if conversation['interviewer']['number'] == from_number_norm
-                else next((ie for ie in conversation['interviewees'] if ie['number'] == from_number_norm), None)
-            )
-            return conversation['conversation_id'], participant, conversation['interviewer']['number']
-
-        queued_conversations = [c for c in conversations if c['status'] == 'queued']
-        if queued_conversations:
-            conversation = sorted(queued_conversations, key=lambda x: x['created_at'], reverse=True)[0]
-            participant = (
-                conversation['interviewer'] 
-                if conversation['interviewer']['number'] == from_number_norm
-                else next((ie for ie in conversation['interviewees'] if ie['number'] == from_number_norm), None)
-            )
-            return conversation['conversation_id'], participant, conversation['interviewer']['number']
+        if len(candidates) == 1:
+            chosen = candidates[0]
+        else:
+            active_conversations = [c for c in candidates if c.get('status') == 'active']
+            queued_conversations = [c for c in candidates if c.get('status') == 'queued']
+            if active_conversations:
+                chosen = sorted(active_conversations, key=lambda x: x['created_at'], reverse=True)[0]
+            elif queued_conversations:
+                chosen = sorted(queued_conversations, key=lambda x: x['created_at'], reverse=True)[0]
+            else:
+                return None, None, None, None
 
-        return None, None, None
+        conversation_id = chosen['conversation_id']
+        conversation = self.scheduler.mongodb_handler.get_conversation(conversation_id)
+        if not conversation:
+            # Removed between the two reads; the caller flags it
+            return conversation_id, None, chosen['interviewer']['number'], None
+
+        participant = (
+            conversation['interviewer'] 
+            if conversation['interviewer']['number'] == from_number_norm
+            else self._get_interviewee(conversation, from_number_norm)
+        )
+        return conversation_id, participant, conversation['interviewer']['number'], conversation
 
     def handle_message_from_interviewer(self, conversation_id: str, interviewer: dict, message: str):
         """
@@ -324,9 +416,7 @@ class MessageHandler:
                         "with the previously identified time slots and to please provide them again.\n\n"
                         f"Current Local Time: {local_now}"
                     )
-                    response = self.generate_response(interviewer, None, message, system_message)
-                    self.scheduler.log_conversation(conversation_id, 'interviewer', "system", response, "AI")
-                    self.send_message(interviewer['number'], response)
+                    self._send_system(conversation_id, interviewer, system_message, message)
 
                     # Create an attention flag for missing temp_slots if you want:
                     self._create_conversation_attention_flag(
@@ -365,9 +455,7 @@ class MessageHandler:
                     "and the assistant will proceed with scheduling the interviews using these new slots.\n\n"
                     f"Current Local Time: {local_now}"
                 )
-                response = self.generate_response(interviewer, None, message, system_message)
-                self.scheduler.log_conversation(conversation_id, 'interviewer', "system", response, "AI")
-                self.send_message(interviewer['number'], response)
+                self._send_system(conversation_id, interviewer, system_message, message)
 
                 # Attempt scheduling for any interviewees who had no slots or were awaiting
                 self.initiate_scheduling_for_no_slots_available(conversation_id)
@@ -395,7 +483,7 @@ class MessageHandler:
                     for slot in extracted_data.get("time_slots", []):
                         start_time = datetime.fromisoformat(slot['start_time'])
                         tz = extracted_data.get('timezone', 'UTC')
-                        slot_str = start_time.astimezone(pytz.timezone(tz)).strftime('%A, %B %d, %Y at %I:%M %p %Z')
+                        slot_str = start_time.astimezone(get_timezone(tz)).strftime(LOCAL_TIME_FORMAT)
                         formatted_slots.append(f"- {slot_str}")
                     slots_text = "\n".join(formatted_slots)
 
@@ -405,9 +493,7 @@ class MessageHandler:
                         "Ask the interviewer to reply with 'yes' to confirm these slots or 'no' to change them.\n\n"
                         f"Current Local Time: {local_now}"
                     )
-                    response = self.generate_response(interviewer, None, message, system_message)
-                    self.scheduler.log_conversation(conversation_id, 'interviewer', "system", response, "AI")
-                    self.send_message(interviewer['number'], response)
+                    self._send_system(conversation_id, interviewer, system_message, message)
                 else:
                     # No valid new slots recognized
                     interviewer['temp_slots'] = None
@@ -420,9 +506,7 @@ class MessageHandler:
                         "Instruct the AI assistant to request the interviewer to share availability again in a clear format.\n\n"
                         f"Current Local Time: {local_now}"
                     )
-                    response = self.generate_response(interviewer, None, message, system_message)
-                    self.scheduler.log_conversation(conversation_id, 'interviewer', "system", response, "AI")
-                    self.send_message(interviewer['number'], response)
+                    self._send_system(conversation_id, interviewer, system_message, message)
 
         elif interviewer.get('state') == ConversationState.AWAITING_MORE_SLOTS_FROM_INTERVIEWER.value:
             # The system specifically requested more slots from the interviewer
@@ -459,22 +543,19 @@ class MessageHandler:
                     "Then the assistant should attempt to schedule any remaining interviewees.\n\n"
                     f"Current Local Time: {local_now}"
                 )
-                response = self.generate_response(interviewer, None, message, system_message)
-                self.scheduler.log_conversation(conversation_id, 'interviewer', "system", response, "AI")
-                self.send_message(interviewer['number'], response)
+                self._send_system(conversation_id, interviewer, system_message, message)
 
                 # Make any unscheduled interviewees AWAITING_AVAILABILITY
                 unscheduled = [
                     ie for ie in conversation['interviewees']
-                    if ie['state'] in [ConversationState.NO_SLOTS_AVAILABLE.value,
-                                       ConversationState.AWAITING_AVAILABILITY.value]
+                    if ie['state'] in _RETRYABLE_STATES
                 ]
                 for ie in unscheduled:
                     ie['state'] = ConversationState.AWAITING_AVAILABILITY.value
 
-                self.scheduler.mongodb_handler.update_conversation(conversation_id, {
-                    'interviewees': conversation['interviewees']
-                })
+                self.scheduler.mongodb_handler.update_interviewees(
+                    conversation_id, [ie['number'] for ie in unscheduled], {'state': _AWAITING_AVAILABILITY}
+                )
 
                 # Start scheduling again for the first unscheduled interviewee, if any
                 if unscheduled:
@@ -494,9 +575,7 @@ class MessageHandler:
                     "detected in their message. Request them to please provide clear availability again.\n\n"
                     f"Current Local Time: {local_now}"
                 )
-                response = self.generate_response(interviewer, None, message, system_message)
-                self.scheduler.log_conversation(conversation_id, 'interviewer', "system", response, "AI")
-                self.send_message(interviewer['number'], response)
+                self._send_system(conversation_id, interviewer, system_message, message)
 
         else:
             # Normal scenario: the interviewer shares slots for the first time or is continuing conversation
@@ -521,7 +600,7 @@ class MessageHandler:
                 for slot in extracted_data.get("time_slots", []):
                     start_time = datetime.fromisoformat(slot['start_time'])
                     tz = extracted_data.get('timezone', 'UTC')
-                    local_str = start_time.astimezone(pytz.timezone(tz)).strftime('%A, %B %d, %Y at %I:%M %p %Z')
+                    local_str = start_time.astimezone(get_timezone(tz)).strftime(LOCAL_TIME_FORMAT)
                     formatted_slots.append(f"- {local_str}")
                 slots_text = "\n".join(formatted_slots)
 
@@ -531,9 +610,7 @@ class MessageHandler:
                     "Ask the interviewer to reply with 'yes' to confirm these slots or 'no' if they need to provide different slots.\n\n"
                     f"Current Local Time: {local_now}"
                 )
-                response = self.generate_response(interviewer, None, message, system_message)
-                self.scheduler.log_conversation(conversation_id, 'interviewer', "system", response, "AI")
-                self.send_message(interviewer['number'], response)
+                self._send_system(conversation_id, interviewer, system_message, message)
             else:
                 # Could not parse any slots at all
                 system_message = (
@@ -541,9 +618,7 @@ class MessageHandler:
                     "and to please provide it in a clear format.\n\n"
                     f"Current Local Time: {local_now}"
                 )
-                response = self.generate_response(interviewer, None, message, system_message)
-                self.scheduler.log_conversation(conversation_id, 'interviewer', "system", response, "AI")
-                self.send_message(interviewer['number'], response)
+                self._send_system(conversation_id, interviewer, system_message, message)
 
     def handle_message_from_interviewee(self, conversation_id: str, interviewee: dict, message: str):
         """
@@ -580,8 +655,6 @@ class MessageHandler:
         If the interviewee accepts a slot, remove it from availability, mark them SCHEDULED, 
         and finalize if needed.
         """
-        reserved_slots = conversation.get('reserved_slots', [])
-        available_slots = conversation.get('available_slots', [])
         if not interviewee.get('proposed_slot'):
             # Safety check in case there's no slot proposed
             self._create_conversation_attention_flag(
@@ -593,28 +666,18 @@ class MessageHandler:
 
         accepted_slot_key = self._create_slot_key(interviewee['proposed_slot'])
 
-        # Remove from reserved and global availability
-        reserved_slots = [
-            slot for slot in reserved_slots
-            if self._create_slot_key(slot) != accepted_slot_key
-        ]
-        available_slots = [
-            slot for slot in available_slots
-            if self._create_slot_key(slot) != accepted_slot_key
-        ]
-
         interviewee['confirmed'] = True
         interviewee['state'] = ConversationState.SCHEDULED.value
 
-        # Update the conversation data
-        for i, ie in enumerate(conversation['interviewees']):
-            if ie['number'] == interviewee['number']:
-                conversation['interviewees'][i] = interviewee
-
-        self.scheduler.mongodb_handler.update_conversation(conversation_id, {
-            'interviewees': conversation['interviewees'],
-            'reserved_slots': reserved_slots,
-            'available_slots': available_slots
+        # Remove from reserved and global availability; only the accepted slot is pulled,
+        # so reservations made since the conversation was read are kept
+        accepted_slot = {'start_time': accepted_slot_key}
+        self.scheduler.mongodb_handler.update_interviewee(conversation_id, interviewee['number'], {
+            'confirmed': True,
+            'state': interviewee['state']
+        }, pulls={
+            'reserved_slots': accepted_slot,
+            'available_slots': accepted_slot
         })
 
         # Possibly finalize or move on
@@ -672,18 +735,22 @@ class MessageHandler:
                 "Ignore their proposed time and proceed to offer the next interviewer-provided slot.\n\n"
                 f"Current Local Time: {local_now}"
             )
-            response = self.generate_response(interviewee, None, message, system_message)
-            self.scheduler.log_conversation(conversation_id, interviewee['number'], "system", response, "AI")
-            self.send_message(interviewee['number'], response)
+            self._send_system(conversation_id, interviewee, system_message, message)
         # --- END NEW ---
 
         # Check if all unscheduled interviewees have denied this slot => remove from global availability
         unscheduled_ies = [
             ie for ie in conversation['interviewees']
-            if ie['state'] not in [ConversationState.SCHEDULED.value, ConversationState.CANCELLED.value]
+            if ie['state'] not in FINAL_STATES
         ]
         all_unscheduled_nums = {ie['number'] for ie in unscheduled_ies}
 
+        # Only the denied slot is pulled from the stored arrays, so slots other requests
+        # reserved or added since the conversation was read are kept
+        pulls = {}
+        if denied_slot_key:
+            pulls['reserved_slots'] = {'start_time': denied_slot_key}
+
         if denied_slot_key and slot_denials[denied_slot_key].issuperset(all_unscheduled_nums):
             before_count = len(available_slots)
             available_slots = [
@@ -692,6 +759,7 @@ class MessageHandler:
             ]
             after_count = len(available_slots)
             if after_count < before_count:
+                pulls['available_slots'] = {'start_time': denied_slot_key}
                 logger.info(
                     f"Slot {denied_slot} removed from available_slots "
                     f"because all unscheduled interviewees denied it."
@@ -702,11 +770,6 @@ class MessageHandler:
             k: list(v) for k, v in slot_denials.items()
         }
 
-        # Reassign updated interviewee object
-        for i, ie in enumerate(conversation['interviewees']):
-            if ie['number'] == interviewee['number']:
-                conversation['interviewees'][i] = interviewee
-
         # Check for any untried slots left for this interviewee
         untried_slots = self._get_untried_slots_for_interviewee(interviewee, available_slots, reserved_slots)
         if untried_slots:
@@ -718,16 +781,13 @@ class MessageHandler:
             )
 
         # Update conversation with the new interviewee state
-        for i, ie in enumerate(conversation['interviewees']):
-            if ie['number'] == interviewee['number']:
-                conversation['interviewees'][i] = interviewee
-
-        self.scheduler.mongodb_handler.update_conversation(conversation_id, {
-            'interviewees': conversation['interviewees'],
-            'reserved_slots': reserved_slots,
-            'available_slots': conversation['available_slots'],
+        self.scheduler.mongodb_handler.update_interviewee(conversation_id, interviewee['number'], {
+            'offered_slots': interviewee['offered_slots'],
+            'proposed_slot': None,
+            'state': interviewee['state']
+        }, {
             'slot_denials': conversation['slot_denials']
-        })
+        }, pulls=pulls)
 
         # Continue scheduling attempts for others or finalize
         self.process_remaining_interviewees(conversation_id)
@@ -759,31 +819,30 @@ class MessageHandler:
                 )
                 return
 
-            # Anyone in AWAITING_AVAILABILITY => propose next slot
-            awaiting = [ie for ie in conversation['interviewees']
-                        if ie['state'] == ConversationState.AWAITING_AVAILABILITY.value]
-            for interviewee in awaiting:
-                self.process_scheduling_for_interviewee(conversation_id, interviewee['number'])
+            # Anyone in AWAITING_AVAILABILITY => propose next slot, assigning all of them together
+            awaiting = [ie for ie in conversation['interviewees'] if ie['state'] == _AWAITING_AVAILABILITY]
+            if awaiting:
+                self.process_scheduling_for_interviewees(
+                    conversation_id,
+                    [ie['number'] for ie in awaiting],
+                    conversation=conversation
+                )
                 changed_something = True
 
             # Anyone in NO_SLOTS_AVAILABLE => check if new slots arrived that they haven't tried
-            no_slots = [ie for ie in conversation['interviewees']
-                        if ie['state'] == ConversationState.NO_SLOTS_AVAILABLE.value]
+            no_slots = [ie for ie in conversation['interviewees'] if ie['state'] == _NO_SLOTS_AVAILABLE]
             if not no_slots:
                 continue
             available_slots = conversation.get('available_slots', [])
             reserved_slots = conversation.get('reserved_slots', [])
-            updated_any = False
-
-            for ie in no_slots:
-                untried = self._get_untried_slots_for_interviewee(ie, available_slots, reserved_slots)
-                if untried:
-                    ie['state'] = ConversationState.AWAITING_AVAILABILITY.value
-                    updated_any = True
+            retryable = [
+                ie['number'] for ie in no_slots
+                if self._get_untried_slots_for_interviewee(ie, available_slots, reserved_slots)
+            ]
 
-            if updated_any:
-                self.scheduler.mongodb_handler.update_conversation(
-                    conversation['conversation_id'], {'interviewees': conversation['interviewees']}
+            if retryable:
+                self.scheduler.mongodb_handler.update_interviewees(
+                    conversation_id, retryable, {'state': _AWAITING_AVAILABILITY}
                 )
                 changed_something = True
 
@@ -797,16 +856,16 @@ class MessageHandler:
             )
             return
 
-        unscheduled = [
-            ie for ie in conversation['interviewees']
-            if ie['state'] not in [ConversationState.SCHEDULED.value, ConversationState.CANCELLED.value]
-        ]
-
-        # If any are still pending confirmation, no need to prompt for more slots yet
-        pending = [ie for ie in unscheduled if ie['state'] == ConversationState.CONFIRMATION_PENDING.value]
-        if pending:
-            logger.info("Some interviewees are in CONFIRMATION_PENDING; scheduling can continue in parallel.")
-            return
+        # Single pass: collect the unscheduled, but stop as soon as anyone is pending
+        # confirmation, since then there is no need to prompt for more slots yet
+        unscheduled = []
+        for ie in conversation['interviewees']:
+            state = ie['state']
+            if state == _CONFIRMATION_PENDING:
+                logger.info("Some interviewees are in CONFIRMATION_PENDING; scheduling can continue in parallel.")
+                return
+            if state not in FINAL_STATES:
+                unscheduled.append(ie)
 
         # If we still have unscheduled interviewees but no immediate next step, we may need more slots
         if unscheduled:
@@ -823,34 +882,46 @@ class MessageHandler:
                         "Finalizing conversation."
                     )
                 )
-                self.complete_conversation(conversation_id)
+                self.complete_conversation(conversation_id, conversation=conversation)
             else:
                 self._request_more_slots(conversation_id, unscheduled, conversation)
         else:
             # Everyone is scheduled or canceled
-            self.complete_conversation(conversation_id)
+            self.complete_conversation(conversation_id, conversation=conversation)
 
-    def process_scheduling_for_interviewee(self, conversation_id: str, interviewee_number: str):
+    def process_scheduling_for_interviewee(self, conversation_id: str, interviewee_number: str,
+                                           conversation: Optional[dict] = None,
+                                           pending_fields: Optional[dict] = None,
+                                           check_remaining: bool = True) -> bool:
         """
         Attempts to propose the next untried slot to the interviewee. 
         If none are available, sets them to NO_SLOTS_AVAILABLE and checks next steps.
+
+        Callers that already hold the conversation can pass it in, along with any interviewee
+        fields they changed but have not saved yet; those are persisted together with the
+        scheduling fields in a single update instead of costing an extra round-trip.
+        Callers scheduling several interviewees pass check_remaining=False and run
+        process_remaining_interviewees once themselves.
+
+        Returns:
+            bool: True if the interviewee was moved to NO_SLOTS_AVAILABLE.
         """
-        conversation = self.scheduler.mongodb_handler.get_conversation(conversation_id)
+        if conversation is None:
+            conversation = self.scheduler.mongodb_handler.get_conversation(conversation_id)
         if not conversation:
             self._create_conversation_attention_flag(
                 conversation_id,
                 title="No Conversation in process_scheduling_for_interviewee",
                 description=f"Cannot schedule because conversation {conversation_id} missing."
             )
-            return
+            return False
 
         # If the conversation is completed, do not proceed.
         if conversation.get('status') == 'completed':
             logger.info(f"Skipping scheduling for interviewee {interviewee_number} in a completed conversation.")
-            return
+            return False
 
-        interviewee = next((ie for ie in conversation['interviewees']
-                            if ie['number'] == interviewee_number), None)
+        interviewee = self._get_interviewee(conversation, interviewee_number)
         if not interviewee:
             logger.error(f"Interviewee {interviewee_number} not found in conversation {conversation_id}.")
             self._create_conversation_attention_flag(
@@ -858,67 +929,241 @@ class MessageHandler:
                 title="Interviewee Not Found",
                 description=f"Interviewee {interviewee_number} not found for scheduling in conversation {conversation_id}."
             )
-            return
+            return False
+
+        # Only the fields that changed are written, never the whole sub-document
+        pending_fields = dict(pending_fields) if pending_fields else {}
 
         # If this interviewee is currently waiting for them to confirm or deny a slot, skip
         if interviewee['state'] == ConversationState.CONFIRMATION_PENDING.value:
-            return
+            if pending_fields:
+                # Still flush whatever the caller changed before handing the conversation over
+                self.scheduler.mongodb_handler.update_interviewee(conversation_id, interviewee_number, pending_fields)
+            return False
 
         available_slots = conversation.get('available_slots', [])
         reserved_slots = conversation.get('reserved_slots', [])
 
-        untried = self._get_untried_slots_for_interviewee(interviewee, available_slots, reserved_slots)
-        if untried:
-            next_slot = untried[0]
-            interviewee['proposed_slot'] = next_slot
-            interviewee['state'] = ConversationState.CONFIRMATION_PENDING.value
-            interviewee['offered_slots'] = interviewee.get('offered_slots', []) + [next_slot]
-            reserved_slots.append(next_slot)
-
-            for i, ie in enumerate(conversation['interviewees']):
-                if ie['number'] == interviewee_number:
-                    conversation['interviewees'][i] = interviewee
-
-            self.scheduler.mongodb_handler.update_conversation(conversation_id, {
-                'interviewees': conversation['interviewees'],
-                'reserved_slots': reserved_slots
+        # Reserve the first untried slot nobody else has taken. reserve_slots refuses a slot
+        # another request reserved since the conversation was read, so move on to the next one.
+        proposed_fields = None
+        for slot in self._get_untried_slots_for_interviewee(interviewee, available_slots, reserved_slots):
+            fields = dict(pending_fields)
+            fields.update({
+                'proposed_slot': slot,
+                'state': ConversationState.CONFIRMATION_PENDING.value,
+                'offered_slots': interviewee.get('offered_slots', []) + [slot]
             })
+            if self.scheduler.mongodb_handler.reserve_slots(
+                conversation_id, [slot], interviewee_fields={interviewee_number: fields}
+            ):
+                proposed_fields = fields
+                break
+            logger.info("Slot %s in conversation %s was reserved concurrently; trying the next one.",
+                        slot['start_time'], conversation_id)
+
+        if proposed_fields:
+            # Mirror the write in memory only once it has gone through
+            interviewee.update(proposed_fields)
+            conversation['reserved_slots'] = reserved_slots + [proposed_fields['proposed_slot']]
 
             # Send a proposal message to the interviewee with local time
-            timezone_str = interviewee.get('timezone', 'UTC')
-            localized_start_time = datetime.fromisoformat(next_slot['start_time']).astimezone(
-                pytz.timezone(timezone_str)
-            ).strftime('%A, %B %d, %Y at %I:%M %p %Z')
-            local_now = get_localized_current_time(timezone_str)
-
-            system_message = (
-                f"Instruct the AI assistant to propose to {interviewee['name']} the time slot "
-                f"{localized_start_time} and ask if it works for them.\n\n"
-                f"Current Local Time: {local_now}"
-            )
-            response = self.generate_response(
-                interviewee,
-                None,
-                "",
-                system_message,
-                conversation_state=interviewee['state']
-            )
+            response = self._compose_slot_proposal(interviewee)
             self.scheduler.log_conversation(conversation_id, interviewee['number'], "system", response, "AI")
             self.send_message(interviewee['number'], response)
-        else:
-            # No untried slots remain
-            interviewee['state'] = ConversationState.NO_SLOTS_AVAILABLE.value
-            for i, ie in enumerate(conversation['interviewees']):
-                if ie['number'] == interviewee_number:
-                    conversation['interviewees'][i] = interviewee
+            return False
 
-            self.scheduler.mongodb_handler.update_conversation(conversation_id, {
-                'interviewees': conversation['interviewees']
-            })
+        # No untried slots remain
+        interviewee['state'] = ConversationState.NO_SLOTS_AVAILABLE.value
+        pending_fields['state'] = interviewee['state']
+        self.scheduler.mongodb_handler.update_interviewee(conversation_id, interviewee_number, pending_fields)
+
+        logger.info(f"Interviewee {interviewee['name']} has no more untried slots; marking NO_SLOTS_AVAILABLE.")
+        if check_remaining:
+            self.process_remaining_interviewees(conversation_id)
+        return True
+
+    def process_scheduling_for_interviewees(self, conversation_id: str, interviewee_numbers: list,
+                                            conversation: Optional[dict] = None,
+                                            pending_fields: Optional[dict] = None):
+        """
+        Proposes the next untried slot to several interviewees in one pass. The conversation is
+        read once, all reservations are written back in a single atomic update, and the proposal
+        messages are generated and sent concurrently. Anyone left without an untried slot is
+        moved to NO_SLOTS_AVAILABLE.
+
+        pending_fields maps interviewee numbers to fields the caller changed in memory; they are
+        written in the same update, and on their own if the reservation has to be retried.
+        """
+        if conversation is None:
+            conversation = self.scheduler.mongodb_handler.get_conversation(conversation_id)
+        if not conversation:
+            self._create_conversation_attention_flag(
+                conversation_id,
+                title="No Conversation in process_scheduling_for_interviewees",
+                description=f"Cannot schedule because conversation {conversation_id} missing."
+            )
+            return
 
+        if conversation.get('status') == 'completed':
+            logger.info(f"Skipping scheduling for {len(interviewee_numbers)} interviewees in a completed conversation.")
+            return
+
+        wanted = set(interviewee_numbers)
+        candidates = [
+            ie for ie in conversation['interviewees']
+            if ie['number'] in wanted and ie['state'] != ConversationState.CONFIRMATION_PENDING.value
+        ]
+        assignments = self._assign_slots_greedy(conversation, candidates)
+        new_reservations = []
+        proposals = []
+        exhausted = []
+
+        # Only the fields changed here are written, per interviewee, so history and state that
+        # other requests wrote since the conversation was read are left intact
+        interviewee_fields = {number: dict(fields) for number, fields in (pending_fields or {}).items()}
+
+        for interviewee in candidates:
+            next_slot = assignments.get(interviewee['number'])
+            fields = interviewee_fields.setdefault(interviewee['number'], {})
+            if next_slot:
+                fields.update({
+                    'proposed_slot': next_slot,
+                    'state': ConversationState.CONFIRMATION_PENDING.value,
+                    'offered_slots': interviewee.get('offered_slots', []) + [next_slot]
+                })
+                new_reservations.append(next_slot)
+                proposals.append(interviewee)
+            else:
+                # The greedy pass is maximal: every untried slot of this interviewee is taken
+                fields['state'] = ConversationState.NO_SLOTS_AVAILABLE.value
+                exhausted.append(interviewee)
+
+        reserved = self.scheduler.mongodb_handler.reserve_slots(
+            conversation_id,
+            new_reservations,
+            interviewee_fields=interviewee_fields
+        )
+        if not reserved:
+            # Another worker reserved one of these slots first. Persist what the caller changed,
+            # then fall back to one-by-one scheduling, which re-reads the conversation.
+            logger.warning("Bulk reservation failed for conversation %s; scheduling individually.", conversation_id)
+            for number, fields in (pending_fields or {}).items():
+                self.scheduler.mongodb_handler.update_interviewee(conversation_id, number, fields)
+            exhausted_numbers = [
+                number for number in interviewee_numbers
+                if self.process_scheduling_for_interviewee(conversation_id, number, check_remaining=False)
+            ]
+            if exhausted_numbers:
+                self.process_remaining_interviewees(conversation_id)
+            return
+
+        # Mirror the write in memory only once it has gone through
+        for interviewee in candidates:
+            interviewee.update(interviewee_fields[interviewee['number']])
+        conversation['reserved_slots'] = conversation.get('reserved_slots', []) + new_reservations
+
+        if proposals:
+            responses = list(_io_pool.map(self._compose_slot_proposal, proposals))
+            for interviewee, response in zip(proposals, responses):
+                self.scheduler.log_conversation(conversation_id, interviewee['number'], "system", response, "AI")
+            list(_io_pool.map(self.send_message, [ie['number'] for ie in proposals], responses))
+
+        for interviewee in exhausted:
             logger.info(f"Interviewee {interviewee['name']} has no more untried slots; marking NO_SLOTS_AVAILABLE.")
+        if exhausted:
             self.process_remaining_interviewees(conversation_id)
 
+    def _assign_slots_greedy(self, conversation: dict, interviewees: list) -> dict:
+        """
+        Assigns at most one untried slot to each of the given interviewees so that as many
+        of them as possible get a proposal in the same round.
+
+        Every (interviewee, slot) pair is scored on how early the slot is, whether it falls
+        within the interviewee's local working hours, and how contested it is: slots few others
+        can take, and interviewees with few options, are matched first. Pairs are then taken
+        greedily in score order, skipping slots and interviewees already matched in this pass.
+
+        Returns:
+            dict: Interviewee number -> assigned slot. Interviewees left out have no free untried slot.
+        """
+        available_slots = conversation.get('available_slots', [])
+        reserved_slots = conversation.get('reserved_slots', [])
+        if not available_slots or not interviewees:
+            return {}
+
+        slot_rank = {}
+        for index, slot in enumerate(available_slots):
+            slot_rank.setdefault(self._create_slot_key(slot), index)
+
+        options = {
+            ie['number']: self._get_untried_slots_for_interviewee(ie, available_slots, reserved_slots)
+            for ie in interviewees
+        }
+        demand = Counter(self._create_slot_key(slot) for slots in options.values() for slot in slots)
+
+        # Parse each slot's start once for the whole pass rather than once per interviewee
+        slot_starts = {}
+        for key in demand:
+            try:
+                slot_starts[key] = datetime.fromisoformat(key)
+            except ValueError:
+                slot_starts[key] = None
+
+        scored = []
+        for ie in interviewees:
+            ie_options = options[ie['number']]
+            if not ie_options:
+                continue
+            tz = get_timezone(ie.get('timezone') or 'UTC')
+
+            for slot in ie_options:
+                key = self._create_slot_key(slot)
+                earliness = 1 - slot_rank[key] / len(available_slots)
+                start = slot_starts[key]
+                if start is not None:
+                    local_hour = start.astimezone(tz).hour
+                    in_hours = 1.0 if WORKING_HOURS[0] <= local_hour < WORKING_HOURS[1] else 0.0
+                else:
+                    in_hours = 0.0
+                rarity = 1 / demand[key] + 1 / len(ie_options)
+                scored.append((in_hours + earliness + rarity, -slot_rank[key], ie['number'], slot))
+
+        scored.sort(key=lambda item: (item[0], item[1]), reverse=True)
+
+        assignments = {}
+        taken = set()
+        for _, _, number, slot in scored:
+            key = self._create_slot_key(slot)
+            if number in assignments or key in taken:
+                continue
+            assignments[number] = slot
+            taken.add(key)
+        return assignments
+
+    def _compose_slot_proposal(self, interviewee: dict) -> str:
+        """
+        Generates the message proposing the interviewee's current proposed_slot in their local time.
+        """
+        timezone_str = interviewee.get('timezone', 'UTC')
+        localized_start_time = datetime.fromisoformat(interviewee['proposed_slot']['start_time']).astimezone(
+            get_timezone(timezone_str)
+        ).strftime(LOCAL_TIME_FORMAT)
+        local_now = get_localized_current_time(timezone_str)
+
+        system_message = (
+            f"Instruct the AI assistant to propose to {interviewee['name']} the time slot "
+            f"{localized_start_time} and ask if it works for them.\n\n"
+            f"Current Local Time: {local_now}"
+        )
+        return self.generate_response(
+            interviewee,
+            None,
+            "",
+            system_message,
+            conversation_state=interviewee['state']
+        )
+
     def _get_untried_slots_for_interviewee(self, interviewee: dict, available_slots: list, reserved_slots: list) -> list:
         """
         Returns the subset of available_slots that have not been offered to 
@@ -947,7 +1192,7 @@ class MessageHandler:
 
         # If everything is actually scheduled, do not request more slots
         if self.scheduler.is_conversation_complete(conversation):
-            self.complete_conversation(conversation_id)
+            self.complete_conversation(conversation_id, conversation=conversation)
             return
 
         interviewer['state'] = ConversationState.AWAITING_MORE_SLOTS_FROM_INTERVIEWER.value
@@ -980,13 +1225,17 @@ class MessageHandler:
         self.scheduler.log_conversation(conversation_id, 'interviewer', "system", response, "AI")
         self.send_message(interviewer['number'], response)
 
-    def complete_conversation(self, conversation_id: str):
+    def complete_conversation(self, conversation_id: str, conversation: Optional[dict] = None,
+                              preface: Optional[str] = None):
         """
         Marks conversation as completed & notifies the interviewer. 
         Then defers final closure tasks to the InterviewScheduler.
+        Callers holding an up-to-date conversation can pass it to skip re-reading it, and a
+        preface to send their own acknowledgement as part of the completion notice.
         """
         try:
-            conversation = self.scheduler.mongodb_handler.get_conversation(conversation_id)
+            if conversation is None:
+                conversation = self.scheduler.mongodb_handler.get_conversation(conversation_id)
             if not conversation:
                 logger.error(f"Conversation {conversation_id} not found.")
                 self._create_conversation_attention_flag(
@@ -998,9 +1247,7 @@ class MessageHandler:
 
             unscheduled = [
                 ie['name'] for ie in conversation['interviewees']
-                if ie['state'] in [ConversationState.NO_SLOTS_AVAILABLE.value,
-                                   ConversationState.AWAITING_AVAILABILITY.value,
-                                   ConversationState.CONFIRMATION_PENDING.value]
+                if ie['state'] in _UNSCHEDULABLE_STATES
             ]
 
             conversation['status'] = 'completed'
@@ -1009,31 +1256,28 @@ class MessageHandler:
             })
 
             interviewer = conversation['interviewer']
-            tz_str = interviewer.get('timezone', 'UTC')
-            local_now = get_localized_current_time(tz_str)
 
             if unscheduled:
                 note = f"Some interviewees could not be scheduled: {', '.join(unscheduled)}."
             else:
                 note = "All interviews have been successfully scheduled."
 
-            system_message = (
-                "Instruct the AI assistant to inform the interviewer that all scheduling steps have been completed. "
-                f"{note} Thank them for their cooperation.\n\n"
-                f"Current Local Time: {local_now}"
-            )
+            system_message = _MSG_CONVERSATION_COMPLETED.format(note=note)
+            if preface:
+                system_message = f"{preface}\n\n{system_message}"
             response = self.generate_response(
                 interviewer,
                 None,
                 "",
                 system_message,
-                conversation_state=ConversationState.COMPLETED.value
+                conversation_state=ConversationState.COMPLETED.value,
+                deterministic=True
             )
             self.scheduler.log_conversation(conversation_id, 'interviewer', "system", response, "AI")
             self.send_message(interviewer['number'], response)
 
             # Let the InterviewScheduler handle final summary emails/notifications
-            self.scheduler.complete_conversation(conversation_id)
+            self.scheduler.complete_conversation(conversation_id, conversation=conversation)
 
         except Exception as e:
             logger.error(f"Error completing conversation {conversation_id}: {str(e)}")
@@ -1061,8 +1305,7 @@ class MessageHandler:
         if participant_id == 'interviewer':
             participant = conversation['interviewer']
         else:
-            participant = next((ie for ie in conversation['interviewees']
-                                if ie['number'] == participant_id), None)
+            participant = self._get_interviewee(conversation, participant_id)
 
         if not participant:
             logger.error(f"Participant {participant_id} not found in conversation {conversation_id}.")
@@ -1116,27 +1359,19 @@ class MessageHandler:
                     'interviewer': conversation['interviewer']
                 })
             else:
-                for i, ie in enumerate(conversation['interviewees']):
-                    if ie['number'] == participant['number']:
-                        ie['timezone'] = timezone
-                        ie['state'] = ConversationState.AWAITING_AVAILABILITY.value
-                        conversation['interviewees'][i] = ie
-                self.scheduler.mongodb_handler.update_conversation(conversation_id, {
-                    'interviewees': conversation['interviewees']
+                self.scheduler.mongodb_handler.update_interviewee(conversation_id, participant['number'], {
+                    'timezone': timezone,
+                    'state': ConversationState.AWAITING_AVAILABILITY.value
                 })
 
-            local_now = get_localized_current_time(timezone)
-            system_message = (
-                f"Instruct the AI assistant to acknowledge that {participant['name']}'s timezone has been set to {timezone} "
-                f"and request them to provide availability for scheduling.\n\n"
-                f"Current Local Time: {local_now}"
-            )
+            system_message = _MSG_TIMEZONE_SET.format(name=participant['name'], timezone=timezone)
             response = self.generate_response(
                 participant,
                 None,
                 "",
                 system_message,
-                conversation_state=ConversationState.AWAITING_AVAILABILITY.value
+                conversation_state=ConversationState.AWAITING_AVAILABILITY.value,
+                deterministic=True
             )
             self.scheduler.log_conversation(conversation_id, participant['number'], "system", response, "AI")
             self.send_message(participant['number'], response)
@@ -1150,12 +1385,17 @@ class MessageHandler:
                 description=f"Exception: {str(e)}"
             )
 
-    def initiate_conversation_with_interviewee(self, conversation_id: str, interviewee_number: str):
+    def initiate_conversation_with_interviewee(self, conversation_id: str, interviewee_number: str,
+                                               conversation: Optional[dict] = None,
+                                               interviewee: Optional[dict] = None):
         """
         Starts the conversation flow with a newly added interviewee. 
         Tries to detect timezone automatically; if none is found, asks them for it.
+        Callers that already loaded the conversation can pass it, and the interviewee's
+        dict from it, to skip reading and searching it again.
         """
-        conversation = self.scheduler.mongodb_handler.get_conversation(conversation_id)
+        if conversation is None:
+            conversation = self.scheduler.mongodb_handler.get_conversation(conversation_id)
         if not conversation:
             logger.error(f"Conversation {conversation_id} not found.")
             self._create_conversation_attention_flag(
@@ -1169,8 +1409,8 @@ class MessageHandler:
             logger.info(f"Skipping conversation initiation for {interviewee_number} in completed conversation.")
             return
 
-        interviewee = next((ie for ie in conversation['interviewees']
-                            if ie['number'] == interviewee_number), None)
+        if interviewee is None:
+            interviewee = self._get_interviewee(conversation, interviewee_number)
         if not interviewee:
             logger.error(f"Interviewee {interviewee_number} not found in conversation {conversation_id}.")
             self._create_conversation_attention_flag(
@@ -1183,107 +1423,119 @@ class MessageHandler:
         # Attempt to auto-detect the interviewee's timezone from phone number
         interviewee_timezone = extract_timezone_from_number(interviewee['number'])
         if interviewee_timezone and interviewee_timezone.lower() != 'unspecified':
+            # The timezone is written together with the scheduling fields by
+            # process_scheduling_for_interviewee.
             interviewee['timezone'] = interviewee_timezone
-            for i, ie in enumerate(conversation['interviewees']):
-                if ie['number'] == interviewee_number:
-                    conversation['interviewees'][i] = interviewee
 
-            self.scheduler.mongodb_handler.update_conversation(conversation_id, {
-                'interviewees': conversation['interviewees']
-            })
             # Proceed with scheduling if we already have the timezone
-            self.process_scheduling_for_interviewee(conversation_id, interviewee_number)
+            self.process_scheduling_for_interviewee(
+                conversation_id, interviewee_number, conversation=conversation,
+                pending_fields={'timezone': interviewee_timezone}
+            )
         else:
             # If we do not know their timezone, ask for it
             interviewee['state'] = ConversationState.TIMEZONE_CLARIFICATION.value
-            for i, ie in enumerate(conversation['interviewees']):
-                if ie['number'] == interviewee_number:
-                    conversation['interviewees'][i] = interviewee
-
-            self.scheduler.mongodb_handler.update_conversation(conversation_id, {
-                'interviewees': conversation['interviewees']
+            self.scheduler.mongodb_handler.update_interviewee(conversation_id, interviewee_number, {
+                'state': interviewee['state']
             })
+            self._ask_interviewee_for_timezone(conversation_id, interviewee)
 
-            local_now = get_localized_current_time('UTC')
-            system_message = (
-                f"Instruct the AI assistant to ask {interviewee['name']} for their timezone to proceed with scheduling.\n\n"
-                f"Current Local Time (fallback UTC): {local_now}"
-            )
-            response = self.generate_response(
-                interviewee,
-                None,
-                "Null",
-                system_message,
-                conversation_state=interviewee['state']
-            )
-            self.scheduler.log_conversation(conversation_id, interviewee_number, "system", response, "AI")
-            self.send_message(interviewee['number'], response)
+    def _ask_interviewee_for_timezone(self, conversation_id: str, interviewee: dict):
+        """
+        Asks an interviewee in TIMEZONE_CLARIFICATION for their timezone.
+        """
+        local_now = get_localized_current_time('UTC')
+        system_message = (
+            f"Instruct the AI assistant to ask {interviewee['name']} for their timezone to proceed with scheduling.\n\n"
+            f"Current Local Time (fallback UTC): {local_now}"
+        )
+        response = self.generate_response(
+            interviewee,
+            None,
+            "Null",
+            system_message,
+            conversation_state=interviewee['state']
+        )
+        self.scheduler.log_conversation(conversation_id, interviewee['number'], "system", response, "AI")
+        self.send_message(interviewee['number'], response)
 
-    def initiate_scheduling_for_no_slots_available(self, conversation_id: str):
+    def _load_interviewees_in_state(self, conversation_id: str, state: str, caller: str):
         """
-        Called when the interviewer has just provided new slots, to move 
-        interviewees in NO_SLOTS_AVAILABLE to see if we can now schedule them.
+        Reads the conversation once and returns it together with its interviewees in the
+        given state. Returns (None, []) if the conversation is missing or already completed.
         """
         conversation = self.scheduler.mongodb_handler.get_conversation(conversation_id)
         if not conversation:
             logger.error(f"Conversation {conversation_id} not found.")
             self._create_conversation_attention_flag(
                 conversation_id,
-                title="No Conversation in initiate_scheduling_for_no_slots_available",
-                description="Cannot initiate scheduling for no slots."
+                title=f"No Conversation in {caller}",
+                description=f"Cannot initiate scheduling for {state.upper()} interviewees."
             )
-            return
+            return None, []
 
         if conversation.get('status') == 'completed':
-            logger.info(f"Skipping scheduling for NO_SLOTS_AVAILABLE in conversation {conversation_id} (completed).")
-            return
+            logger.info(f"Skipping scheduling for {state.upper()} in conversation {conversation_id} (completed).")
+            return None, []
 
-        no_slots_interviewees = [
-            ie for ie in conversation['interviewees']
-            if ie['state'] == ConversationState.NO_SLOTS_AVAILABLE.value
-        ]
-        if not no_slots_interviewees:
-            logger.info(f"No interviewees with NO_SLOTS_AVAILABLE in conversation {conversation_id}.")
-            return
+        interviewees = [ie for ie in conversation['interviewees'] if ie['state'] == state]
+        if not interviewees:
+            logger.info(f"No interviewees with {state.upper()} in conversation {conversation_id}.")
+        return conversation, interviewees
 
-        for ie in no_slots_interviewees:
-            self.process_scheduling_for_interviewee(conversation_id, ie['number'])
+    def initiate_scheduling_for_no_slots_available(self, conversation_id: str):
+        """
+        Called when the interviewer has just provided new slots, to move 
+        interviewees in NO_SLOTS_AVAILABLE to see if we can now schedule them.
+        """
+        conversation, no_slots_interviewees = self._load_interviewees_in_state(
+            conversation_id, _NO_SLOTS_AVAILABLE, 'initiate_scheduling_for_no_slots_available'
+        )
+        if no_slots_interviewees:
+            self.process_scheduling_for_interviewees(
+                conversation_id, [ie['number'] for ie in no_slots_interviewees], conversation=conversation
+            )
 
     def initiate_scheduling_for_awaiting_availability(self, conversation_id: str):
         """
         Called when the interviewer has just provided new slots, to re-trigger scheduling 
         for interviewees who are awaiting availability.
         """
-        conversation = self.scheduler.mongodb_handler.get_conversation(conversation_id)
-        if not conversation:
-            logger.error(f"Conversation {conversation_id} not found.")
-            self._create_conversation_attention_flag(
-                conversation_id,
-                title="No Conversation in initiate_scheduling_for_awaiting_availability",
-                description="Cannot re-trigger scheduling for interviewees awaiting availability."
-            )
+        conversation, awaiting = self._load_interviewees_in_state(
+            conversation_id, _AWAITING_AVAILABILITY, 'initiate_scheduling_for_awaiting_availability'
+        )
+        if not awaiting:
             return
 
-        if conversation.get('status') == 'completed':
-            logger.info(f"Skipping scheduling for AWAITING_AVAILABILITY in conversation {conversation_id} (completed).")
-            return
+        # Detect everyone's timezone concurrently, then schedule the ones we could place in one batch
+        timezones = list(_io_pool.map(extract_timezone_from_number, [ie['number'] for ie in awaiting]))
+        ready = []
+        unknown = []
+        pending_fields = {}
+        for interviewee, interviewee_timezone in zip(awaiting, timezones):
+            if interviewee_timezone and interviewee_timezone.lower() != 'unspecified':
+                interviewee['timezone'] = interviewee_timezone
+                pending_fields[interviewee['number']] = {'timezone': interviewee_timezone}
+                ready.append(interviewee['number'])
+            else:
+                interviewee['state'] = ConversationState.TIMEZONE_CLARIFICATION.value
+                pending_fields[interviewee['number']] = {'state': interviewee['state']}
+                unknown.append(interviewee)
 
-        awaiting = [
-            ie for ie in conversation['interviewees']
-            if ie['state'] == ConversationState.AWAITING_AVAILABILITY.value
-        ]
-        if not awaiting:
-            logger.info(f"No interviewees with AWAITING_AVAILABILITY in conversation {conversation_id}.")
-            return
+        # The batch write also persists the timezones and TIMEZONE_CLARIFICATION states set above
+        self.process_scheduling_for_interviewees(
+            conversation_id, ready, conversation=conversation, pending_fields=pending_fields
+        )
 
-        for interviewee in awaiting:
-            self.initiate_conversation_with_interviewee(conversation_id, interviewee['number'])
+        for interviewee in unknown:
+            self._ask_interviewee_for_timezone(conversation_id, interviewee)
 
     def handle_query(self, conversation_id: str, participant: dict, message: str):
         """
         Handles generic queries from participants, responding via LLM's 'answer_query' method.
         """
-        conversation = self.scheduler.mongodb_handler.get_conversation(conversation_id)
+        # Only read for context, so the request's cached copy will do
+        conversation = self.scheduler.mongodb_handler.get_conversation(conversation_id, cached=True)
         if not conversation:
             self._create_conversation_attention_flag(
                 conversation_id,
@@ -1330,8 +1582,6 @@ class MessageHandler:
             return
 
         state = interviewer.get('state')
-        tz_str = interviewer.get('timezone', 'UTC')
-        local_now = get_localized_current_time(tz_str)
 
         if state == ConversationState.AWAITING_CANCELLATION_INTERVIEWEE_NAME.value:
             # The interviewer is supposed to name the interviewee whose meeting they want to cancel
@@ -1340,89 +1590,53 @@ class MessageHandler:
                                 if ie['name'].lower() == interviewee_name), None)
 
             if not interviewee:
-                system_message = (
-                    f"Instruct the AI assistant to inform the interviewer that no interviewee named '{interviewee_name}' was found.\n\n"
-                    f"Current Local Time: {local_now}"
-                )
-                response = self.generate_response(interviewer, None, message, system_message)
-                self.scheduler.log_conversation(conversation_id, 'interviewer', "system", response, "AI")
-                self.send_message(interviewer['number'], response)
+                system_message = _MSG_NO_INTERVIEWEE_NAMED.format(name=interviewee_name)
+                self._send_system(conversation_id, interviewer, system_message, message, deterministic=True)
                 return
 
+            interviewer['state'] = ConversationState.CONVERSATION_ACTIVE.value
+            conversation['interviewer'] = interviewer
+
             event_id = interviewee.get('event_id')
             if event_id:
-                delete_success = self.scheduler.calendar_service.delete_event(event_id)
-                if delete_success:
-                    for i, ie in enumerate(conversation['interviewees']):
-                        if ie['number'] == interviewee['number']:
-                            ie['event_id'] = None
-                            ie['state'] = ConversationState.CANCELLED.value
-                            conversation['interviewees'][i] = ie
-                    self.scheduler.mongodb_handler.update_conversation(conversation_id, {
-                        'interviewees': conversation['interviewees']
-                    })
-
-                    cancel_message = (
-                        f"The meeting between {interviewer['name']} and {interviewee['name']} has been cancelled."
-                    )
-                    self.send_message(interviewer['number'], cancel_message)
-                    self.send_message(interviewee['number'], cancel_message)
-
-                    system_message = (
-                        f"Instruct the AI assistant to confirm for the interviewer that the meeting with "
-                        f"{interviewee['name']} has been cancelled.\n\n"
-                        f"Current Local Time: {local_now}"
-                    )
-                    response = self.generate_response(interviewer, None, message, system_message)
-                    self.scheduler.log_conversation(conversation_id, 'interviewer', "system", response, "AI")
-                    self.send_message(interviewer['number'], response)
-                else:
-                    system_message = (
-                        "Instruct the AI assistant to inform the interviewer that the cancellation failed due to an internal error.\n\n"
-                        f"Current Local Time: {local_now}"
-                    )
-                    response = self.generate_response(interviewer, None, message, system_message)
-                    self.scheduler.log_conversation(conversation_id, 'interviewer', "system", response, "AI")
-                    self.send_message(interviewer['number'], response)
+                # Cancel optimistically; the calendar deletion runs in the background and
+                # is rolled back by _handle_failed_event_deletion if it ultimately fails.
+                # The interviewer's state reset goes out in the same write.
+                interviewee['event_id'] = None
+                interviewee['state'] = ConversationState.CANCELLED.value
+                self.scheduler.mongodb_handler.update_interviewee(conversation_id, interviewee['number'], {
+                    'event_id': None,
+                    'state': interviewee['state']
+                }, {
+                    'interviewer.state': interviewer['state']
+                })
+                self._delete_event_in_background(conversation_id, interviewee, event_id)
 
-                    self._create_conversation_attention_flag(
-                        conversation_id,
-                        title="Cancellation Failed",
-                        description=f"Failed to delete calendar event {event_id} for {interviewee_name}."
-                    )
-            else:
-                system_message = (
-                    f"Instruct the AI assistant to inform the interviewer that no scheduled meeting was found for {interviewee['name']}.\n\n"
-                    f"Current Local Time: {local_now}"
+                self.send_message(
+                    interviewee['number'],
+                    _MSG_MEETING_CANCELLED.format(interviewer=interviewer['name'], interviewee=interviewee['name'])
                 )
-                response = self.generate_response(interviewer, None, message, system_message)
-                self.scheduler.log_conversation(conversation_id, 'interviewer', "system", response, "AI")
-                self.send_message(interviewer['number'], response)
-
-            interviewer['state'] = ConversationState.CONVERSATION_ACTIVE.value
-            self.scheduler.mongodb_handler.update_conversation(conversation_id, {
-                'interviewer': interviewer
-            })
+                system_message = _MSG_CANCELLED_FOR_INTERVIEWER.format(name=interviewee['name'])
+            else:
+                self.scheduler.mongodb_handler.update_conversation(conversation_id, {
+                    'interviewer.state': interviewer['state']
+                })
+                system_message = _MSG_NOTHING_TO_CANCEL.format(name=interviewee['name'])
 
-            # Check if the conversation can be completed after this cancellation
+            # If this cancellation completes the conversation, the completion notice carries
+            # the acknowledgement so the interviewer gets a single message.
             if self.scheduler.is_conversation_complete(conversation):
-                self.complete_conversation(conversation_id)
+                self.complete_conversation(conversation_id, conversation=conversation, preface=system_message)
+            else:
+                self._send_system(conversation_id, interviewer, system_message, message, deterministic=True)
 
         else:
             # We haven't asked them to specify which interviewee yet
+            # The state change goes out in the same write as the logged question
             interviewer['state'] = ConversationState.AWAITING_CANCELLATION_INTERVIEWEE_NAME.value
-            self.scheduler.mongodb_handler.update_conversation(conversation_id, {
-                'interviewer': interviewer
-            })
-
-            system_message = (
-                "Instruct the AI assistant to ask the interviewer for the name of the interviewee whose meeting "
-                "they wish to cancel.\n\n"
-                f"Current Local Time: {local_now}"
-            )
-            response = self.generate_response(interviewer, None, message, system_message)
-            self.scheduler.log_conversation(conversation_id, 'interviewer', "system", response, "AI")
-            self.send_message(interviewer['number'], response)
+            system_message = _MSG_ASK_NAME_TO_CANCEL_INTERVIEWER
+            self._send_system(conversation_id, interviewer, system_message, message, deterministic=True,
+                              update_data={'interviewer.state': interviewer['state']})
 
     def handle_cancellation_request_interviewee(self, conversation_id: str, interviewee: dict, message: str):
         """
@@ -1439,8 +1653,6 @@ class MessageHandler:
             return
 
         interviewer = conversation.get('interviewer')
-        tz_str = interviewee.get('timezone', 'UTC')
-        local_now = get_localized_current_time(tz_str)
 
         extracted_name = self.llm_model.extract_interviewee_name(message)
         if extracted_name:
@@ -1452,85 +1664,48 @@ class MessageHandler:
             if interviewee_obj:
                 event_id = interviewee_obj.get('event_id')
                 if event_id:
-                    delete_success = self.scheduler.calendar_service.delete_event(event_id)
-                    if delete_success:
-                        for i, ie in enumerate(conversation['interviewees']):
-                            if ie['number'] == interviewee_obj['number']:
-                                ie['event_id'] = None
-                                ie['state'] = ConversationState.CANCELLED.value
-                                conversation['interviewees'][i] = ie
-                        self.scheduler.mongodb_handler.update_conversation(conversation_id, {
-                            'interviewees': conversation['interviewees']
-                        })
-
-                        cancel_message = (
-                            f"The meeting between {interviewer['name']} and {interviewee_obj['name']} has been cancelled."
-                        )
-                        self.send_message(interviewer['number'], cancel_message)
-                        self.send_message(interviewee_obj['number'], cancel_message)
-
-                        system_message = (
-                            f"Instruct the AI assistant to confirm that the meeting with {interviewee_obj['name']} was cancelled.\n\n"
-                            f"Current Local Time: {local_now}"
-                        )
-                        response = self.generate_response(interviewee_obj, None, message, system_message)
-                        self.scheduler.log_conversation(conversation_id, interviewee_obj['number'], "system", response, "AI")
-                        self.send_message(interviewee_obj['number'], response)
-                    else:
-                        system_message = (
-                            "Instruct the AI assistant to inform the participant that the cancellation failed due to an internal error.\n\n"
-                            f"Current Local Time: {local_now}"
-                        )
-                        response = self.generate_response(interviewee_obj, None, message, system_message)
-                        self.scheduler.log_conversation(conversation_id, interviewee_obj['number'], "system", response, "AI")
-                        self.send_message(interviewee_obj['number'], response)
-
-                        self._create_conversation_attention_flag(
-                            conversation_id,
-                            title="Cancellation Failed",
-                            description=f"Failed to delete event {event_id} for {interviewee_obj['name']}."
-                        )
-                else:
-                    system_message = (
-                        f"Instruct the AI assistant to inform the participant that no scheduled meeting was found for {interviewee_obj['name']}.\n\n"
-                        f"Current Local Time: {local_now}"
+                    # Cancel optimistically; see handle_cancellation_request_interviewer
+                    interviewee_obj['event_id'] = None
+                    interviewee_obj['state'] = ConversationState.CANCELLED.value
+                    self.scheduler.mongodb_handler.update_interviewee(conversation_id, interviewee_obj['number'], {
+                        'event_id': None,
+                        'state': interviewee_obj['state']
+                    })
+                    self._delete_event_in_background(conversation_id, interviewee_obj, event_id)
+
+                    cancel_message = _MSG_MEETING_CANCELLED.format(
+                        interviewer=interviewer['name'], interviewee=interviewee_obj['name']
                     )
-                    response = self.generate_response(interviewee_obj, None, message, system_message)
-                    self.scheduler.log_conversation(conversation_id, interviewee_obj['number'], "system", response, "AI")
-                    self.send_message(interviewee_obj['number'], response)
+                    list(_io_pool.map(self.send_message, [interviewer['number'], interviewee_obj['number']], [cancel_message] * 2))
+
+                    system_message = _MSG_CANCELLED_FOR_INTERVIEWEE.format(name=interviewee_obj['name'])
+                    self._send_system(conversation_id, interviewee_obj, system_message, message, deterministic=True)
+                else:
+                    system_message = _MSG_NOTHING_TO_CANCEL.format(name=interviewee_obj['name'])
+                    self._send_system(conversation_id, interviewee_obj, system_message, message, deterministic=True)
             else:
-                system_message = (
-                    f"Instruct the AI assistant to inform the interviewee that no interviewee named '{extracted_name}' was found.\n\n"
-                    f"Current Local Time: {local_now}"
-                )
-                response = self.generate_response(interviewee, None, message, system_message)
-                self.scheduler.log_conversation(conversation_id, interviewee['number'], "system", response, "AI")
-                self.send_message(interviewee['number'], response)
+                system_message = _MSG_NO_INTERVIEWEE_NAMED.format(name=extracted_name)
+                self._send_system(conversation_id, interviewee, system_message, message, deterministic=True)
         else:
             # We couldn't parse the name, ask them for it
             interviewee['state'] = ConversationState.AWAITING_INTERVIEWEE_NAME.value
-            for i, ie in enumerate(conversation['interviewees']):
-                if ie['number'] == interviewee['number']:
-                    conversation['interviewees'][i] = interviewee
-            self.scheduler.mongodb_handler.update_conversation(conversation_id, {
-                'interviewees': conversation['interviewees']
+            self.scheduler.mongodb_handler.update_interviewee(conversation_id, interviewee['number'], {
+                'state': interviewee['state']
             })
 
-            system_message = (
-                "Instruct the AI assistant to ask the interviewee for the name of the interviewee whose interview "
-                "they wish to cancel.\n\n"
-                f"Current Local Time: {local_now}"
-            )
-            response = self.generate_response(interviewee, None, message, system_message)
-            self.scheduler.log_conversation(conversation_id, interviewee['number'], "system", response, "AI")
-            self.send_message(interviewee['number'], response)
+            system_message = _MSG_ASK_NAME_TO_CANCEL_INTERVIEWEE
+            self._send_system(conversation_id, interviewee, system_message, message, deterministic=True)
 
-    def handle_reschedule_request_interviewer(self, conversation_id: str, interviewer: dict, message: str):
+    def handle_reschedule_request_interviewer(self, conversation_id: str, interviewer: dict, message: str,
+                                              conversation: Optional[dict] = None):
         """
         Handles a rescheduling request from an interviewer. If there's exactly one scheduled 
         interviewee, tries to reschedule that automatically; otherwise asks which interviewee.
+        receive_message passes the conversation it already loaded to skip a second read; it was
+        read before the message was logged, so only interviewee states and event ids are taken from it.
         """
-        conversation = self.scheduler.mongodb_handler.get_conversation(conversation_id)
+        if conversation is None:
+            conversation = self.scheduler.mongodb_handler.get_conversation(conversation_id)
         if not conversation:
             self._create_conversation_attention_flag(
                 conversation_id,
@@ -1540,91 +1715,60 @@ class MessageHandler:
             return
 
         scheduled = [ie for ie in conversation['interviewees'] if ie.get('event_id')]
-        tz_str = interviewer.get('timezone', 'UTC')
-        local_now = get_localized_current_time(tz_str)
 
         if not scheduled:
-            system_message = (
-                "Instruct the AI assistant to inform the interviewer that no scheduled meeting was found to reschedule.\n\n"
-                f"Current Local Time: {local_now}"
-            )
-            response = self.generate_response(interviewer, None, message, system_message)
-            self.scheduler.log_conversation(conversation_id, 'interviewer', "system", response, "AI")
-            self.send_message(interviewer['number'], response)
+            system_message = _MSG_NOTHING_TO_RESCHEDULE
+            self._send_system(conversation_id, interviewer, system_message, message, deterministic=True)
             return
 
         if len(scheduled) == 1:
             # If exactly one interviewee is scheduled, attempt immediate rescheduling
             target_ie = scheduled[0]
             event_id = target_ie.get('event_id')
-            if event_id:
-                delete_success = self.scheduler.calendar_service.delete_event(event_id)
-                if delete_success:
-                    for i, ie in enumerate(conversation['interviewees']):
-                        if ie['number'] == target_ie['number']:
-                            ie['event_id'] = None
-                            ie['state'] = ConversationState.AWAITING_AVAILABILITY.value
-                            ie['reschedule_count'] = ie.get('reschedule_count', 0) + 1
-                            conversation['interviewees'][i] = ie
-                    self.scheduler.mongodb_handler.update_conversation(conversation_id, {
-                        'interviewees': conversation['interviewees']
-                    })
-
-                    system_message = (
-                        f"Instruct the AI assistant to inform the interviewer that the meeting with {target_ie['name']} "
-                        f"is being rescheduled and to proceed with collecting new availability.\n\n"
-                        f"Current Local Time: {local_now}"
-                    )
-                    response = self.generate_response(interviewer, None, message, system_message)
-                    self.scheduler.log_conversation(conversation_id, 'interviewer', "system", response, "AI")
-                    self.send_message(interviewer['number'], response)
-
-                    # Immediately move on to re-propose slots for that interviewee
-                    self.process_scheduling_for_interviewee(conversation_id, target_ie['number'])
-                else:
-                    system_message = (
-                        "Instruct the AI assistant to inform the interviewer that the rescheduling failed due to an internal error.\n\n"
-                        f"Current Local Time: {local_now}"
-                    )
-                    response = self.generate_response(interviewer, None, message, system_message)
-                    self.scheduler.log_conversation(conversation_id, 'interviewer', "system", response, "AI")
-                    self.send_message(interviewer['number'], response)
-
-                    self._create_conversation_attention_flag(
-                        conversation_id,
-                        title="Reschedule Failed",
-                        description=f"Failed to delete event {event_id} for {target_ie['name']} in interviewer reschedule."
-                    )
-            else:
-                system_message = (
-                    f"Instruct the AI assistant to inform the interviewer that no scheduled meeting was found for {target_ie['name']}.\n\n"
-                    f"Current Local Time: {local_now}"
+            # The old event must be gone before a new slot is booked, or the interviewee ends up
+            # with two events, so this deletion stays on the request path
+            if event_id and not self.scheduler.calendar_service.delete_event(event_id):
+                self._send_system(conversation_id, interviewer, _MSG_RESCHEDULE_FAILED, message, deterministic=True)
+                self._create_conversation_attention_flag(
+                    conversation_id,
+                    title="Reschedule Failed",
+                    description=f"Failed to delete event {event_id} for {target_ie['name']} in interviewer reschedule."
                 )
-                response = self.generate_response(interviewer, None, message, system_message)
-                self.scheduler.log_conversation(conversation_id, 'interviewer', "system", response, "AI")
-                self.send_message(interviewer['number'], response)
+            elif event_id:
+                target_ie['event_id'] = None
+                target_ie['state'] = ConversationState.AWAITING_AVAILABILITY.value
+                target_ie['reschedule_count'] = target_ie.get('reschedule_count', 0) + 1
+                self.scheduler.mongodb_handler.update_interviewee(conversation_id, target_ie['number'], {
+                    'event_id': None,
+                    'state': target_ie['state']
+                }, increments={'reschedule_count': 1})
+
+                system_message = _MSG_RESCHEDULING.format(name=target_ie['name'])
+                self._send_system(conversation_id, interviewer, system_message, message, deterministic=True)
+
+                # Immediately move on to re-propose slots for that interviewee
+                self.process_scheduling_for_interviewee(conversation_id, target_ie['number'])
+            else:
+                system_message = _MSG_NOTHING_TO_RESCHEDULE_FOR.format(name=target_ie['name'])
+                self._send_system(conversation_id, interviewer, system_message, message, deterministic=True)
         else:
             # Multiple interviewees are scheduled, so we need to ask which one
+            # The state change goes out in the same write as the logged question
             interviewer['state'] = ConversationState.AWAITING_CANCELLATION_INTERVIEWEE_NAME.value
-            self.scheduler.mongodb_handler.update_conversation(conversation_id, {
-                'interviewer': interviewer
-            })
+            system_message = _MSG_ASK_NAME_TO_RESCHEDULE
+            self._send_system(conversation_id, interviewer, system_message, message, deterministic=True,
+                              update_data={'interviewer.state': interviewer['state']})
 
-            system_message = (
-                "Instruct the AI assistant to ask the interviewer which interviewee's meeting they wish to reschedule, "
-                "since multiple interviews are scheduled.\n\n"
-                f"Current Local Time: {local_now}"
-            )
-            response = self.generate_response(interviewer, None, message, system_message)
-            self.scheduler.log_conversation(conversation_id, 'interviewer', "system", response, "AI")
-            self.send_message(interviewer['number'], response)
-
-    def handle_reschedule_request_interviewee(self, conversation_id: str, interviewee: dict, message: str):
+    def handle_reschedule_request_interviewee(self, conversation_id: str, interviewee: dict, message: str,
+                                              conversation: Optional[dict] = None):
         """
         Handles a rescheduling request from an interviewee. If there's an event_id, 
         we delete and set them back to AWAITING_AVAILABILITY.
+        receive_message passes the conversation it already loaded to skip a second read; it was
+        read before the message was logged, so only interviewee states and event ids are taken from it.
         """
-        conversation = self.scheduler.mongodb_handler.get_conversation(conversation_id)
+        if conversation is None:
+            conversation = self.scheduler.mongodb_handler.get_conversation(conversation_id)
         if not conversation:
             self._create_conversation_attention_flag(
                 conversation_id,
@@ -1634,28 +1778,27 @@ class MessageHandler:
             return
 
         event_id = interviewee.get('event_id')
-        tz_str = interviewee.get('timezone', 'UTC')
-        local_now = get_localized_current_time(tz_str)
 
         if event_id:
             delete_success = self.scheduler.calendar_service.delete_event(event_id)
             if delete_success:
-                for i, ie in enumerate(conversation['interviewees']):
-                    if ie['number'] == interviewee['number']:
-                        ie['event_id'] = None
-                        ie['state'] = ConversationState.AWAITING_AVAILABILITY.value
-                        ie['reschedule_count'] = ie.get('reschedule_count', 0) + 1
-                        conversation['interviewees'][i] = ie
-                self.scheduler.mongodb_handler.update_conversation(conversation_id, {
-                    'interviewees': conversation['interviewees']
+                stored = self._get_interviewee(conversation, interviewee['number'])
+                stored.update({
+                    'event_id': None,
+                    'state': ConversationState.AWAITING_AVAILABILITY.value,
+                    'reschedule_count': stored.get('reschedule_count', 0) + 1
                 })
+                self.scheduler.mongodb_handler.update_interviewee(conversation_id, interviewee['number'], {
+                    'event_id': None,
+                    'state': stored['state']
+                }, increments={'reschedule_count': 1})
                 self.process_scheduling_for_interviewee(conversation_id, interviewee['number'])
             else:
                 system_message = (
-                    "Instruct the AI assistant to inform the interviewee that the rescheduling failed due to an internal error.\n\n"
-                    f"Current Local Time: {local_now}"
+                    "Sorry, we couldn't reschedule your interview due to an internal error. "
+                    "Our team has been notified and will follow up with you."
                 )
-                response = self.generate_response(interviewee, None, message, system_message)
+                response = self.generate_response(interviewee, None, message, system_message, deterministic=True)
                 self.scheduler.log_conversation(conversation_id, interviewee['number'], "system", response, "AI")
                 self.send_message(interviewee['number'], response)
 
@@ -1665,16 +1808,61 @@ class MessageHandler:
                     description=f"Failed to delete event {event_id} for interviewee {interviewee['name']}."
                 )
         else:
-            system_message = (
-                "Instruct the AI assistant to inform the interviewee that no scheduled meeting was found to reschedule.\n\n"
-                f"Current Local Time: {local_now}"
+            system_message = _MSG_NOTHING_TO_RESCHEDULE
+            self._send_system(conversation_id, interviewee, system_message, message, deterministic=True)
+
+            # Only this branch leaves every state untouched; a reschedule puts the interviewee
+            # back into AWAITING_AVAILABILITY, so the conversation cannot be complete there.
+            # The states are all the check reads, but the passed-in copy predates the messages
+            # logged since, so complete_conversation re-reads the conversation for its summary.
+            if self.scheduler.is_conversation_complete(conversation):
+                self.complete_conversation(conversation_id)
+
+    def _delete_event_in_background(self, conversation_id: str, interviewee: dict, event_id: str):
+        """
+        Deletes a cancelled interviewee's calendar event off the request path. The caller has
+        already marked the interviewee CANCELLED as if the deletion succeeded.
+        """
+        interviewee_number = interviewee['number']
+        interviewee_name = interviewee['name']
+        self.scheduler.calendar_service.delete_event_async(
+            event_id,
+            on_failure=lambda failed_event_id: self._handle_failed_event_deletion(
+                conversation_id, interviewee_number, interviewee_name, failed_event_id
             )
-            response = self.generate_response(interviewee, None, message, system_message)
-            self.scheduler.log_conversation(conversation_id, interviewee['number'], "system", response, "AI")
-            self.send_message(interviewee['number'], response)
+        )
 
-        if self.scheduler.is_conversation_complete(conversation):
-            self.complete_conversation(conversation_id)
+    def _handle_failed_event_deletion(self, conversation_id: str, interviewee_number: str, interviewee_name: str,
+                                      event_id: str):
+        """
+        Compensates for a background calendar deletion that ultimately failed. If the cancellation
+        still stands, the interviewee gets their event back as SCHEDULED and both participants are
+        told the meeting is still on; in every case an attention flag is raised.
+        """
+        # A filtered write, so a later cancellation, reschedule or completion is never undone
+        restored = self.scheduler.mongodb_handler.update_interviewee(
+            conversation_id, interviewee_number,
+            {'event_id': event_id, 'state': _SCHEDULED},
+            expected={'state': _CANCELLED, 'event_id': None},
+            filter_data={'status': {'$ne': 'completed'}}
+        )
+        if restored:
+            conversation = self.scheduler.mongodb_handler.get_conversation(conversation_id)
+            if conversation:
+                notice = _MSG_CANCELLATION_FAILED.format(
+                    interviewer=conversation['interviewer']['name'], interviewee=interviewee_name
+                )
+                for number in (conversation['interviewer']['number'], interviewee_number):
+                    self.send_message(number, notice)
+
+        description = f"Failed to delete calendar event {event_id} for {interviewee_name}."
+        if not restored:
+            description += " The conversation changed since the cancellation, so the event must be removed by hand."
+        self._create_conversation_attention_flag(
+            conversation_id,
+            title="Calendar Deletion Failed",
+            description=description
+        )
 
     def _create_slot_key(self, slot):
         """
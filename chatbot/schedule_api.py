@@ -1,16 +1,47 @@
 # chatbot/schedule_api.py
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 import logging
 from typing import Dict, Optional
 from dotenv import load_dotenv
 
-load_dotenv()
+# Parse .env once per process; other modules importing this one skip the file read
+if not os.environ.get("_DOTENV_LOADED"):
+    load_dotenv()
+    os.environ["_DOTENV_LOADED"] = "1"
 
 logger = logging.getLogger(__name__)
 
+API_KEY = os.getenv("API_KEY")
+
+# (connect, read) timeouts in seconds for calls to the scheduling API
+REQUEST_TIMEOUT = (3.05, 10)
+
+def _create_session() -> requests.Session:
+    """
+    Builds a session whose pooled keep-alive connections are shared by every ScheduleAPI call.
+    Failed connects and 502/503/504 responses to idempotent requests are retried; a POST
+    that reached the server is not, so an event is never created twice.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({
+        "x-api-key": API_KEY,
+        "Content-Type": "application/json"
+    })
+    return session
+
 class ScheduleAPI:
     BASE_URL = os.getenv("API_BASE_URL", "http://localhost:5000")  # Default if not set
+    _session = _create_session()
 
     def post_to_create_event(self, conversation_id: str, interviewee_number: str) -> Optional[Dict]:
         """
@@ -19,11 +50,7 @@ class ScheduleAPI:
         try:
             url = f"{self.BASE_URL}/api/create_event/{conversation_id}"
             data = {'interviewee_number': interviewee_number}
-            headers = {
-                "x-api-key": os.getenv("API_KEY"),
-                "Content-Type": "application/json"
-            }
-            response = requests.post(url, json=data, headers=headers)
+            response = self._session.post(url, json=data, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             api_response = response.json()
 
@@ -0,0 +1,22 @@
+# chatbot/timezones.py
+
+# Timezone lookups shared by the chatbot and the calendar service. Kept free of the LLM and
+# environment setup in chatbot.utils so the calendar layer can import it on its own.
+
+from functools import lru_cache
+import logging
+import pytz
+
+logger = logging.getLogger(__name__)
+
+@lru_cache(maxsize=256)
+def get_timezone(timezone_str: str):
+    """
+    Returns the pytz timezone for the given name. Lookups are memoized because pytz
+    reads the zoneinfo database on every call. Unknown names fall back to UTC.
+    """
+    try:
+        return pytz.timezone(timezone_str)
+    except pytz.UnknownTimeZoneError:
+        logger.error(f"Unknown timezone: {timezone_str}. Defaulting to UTC.")
+        return pytz.UTC
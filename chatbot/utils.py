@@ -2,36 +2,70 @@
 
 import json
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 import pytz
 import logging
+import time
 from langchain.prompts import PromptTemplate
 from langchain_google_genai import ChatGoogleGenerativeAI
 from dotenv import load_dotenv
+import os
 import re
-
-load_dotenv()
+from chatbot.timezones import get_timezone
+
+# phonenumbers resolves most numbers to a timezone offline; without it every lookup goes to the LLM
+try:
+    import phonenumbers
+    from phonenumbers import timezone as phonenumbers_timezone
+except ImportError:
+    phonenumbers = None
+
+# orjson parses LLM replies several times faster when installed; its JSONDecodeError
+# subclasses json.JSONDecodeError, so the except clauses below cover both parsers.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Parse .env once per process; other modules importing this one skip the file read
+if not os.environ.get("_DOTENV_LOADED"):
+    load_dotenv()
+    os.environ["_DOTENV_LOADED"] = "1"
 
 # Configure logging
 logger = logging.getLogger(__name__)
 if not logger.hasHandlers():
     logging.basicConfig(level=logging.INFO)
 
+# Markdown code fence (``` or ```json) wrapping the JSON in an LLM reply; the payload is
+# taken straight from the match instead of stripping the fences out of the whole reply
+_FENCE_RE = re.compile(r'```(?:json)?\s*(.*?)\s*```', re.DOTALL)
+
+def _extract_json_payload(llm_output: str) -> str:
+    """
+    Returns the JSON text inside the first code fence of an LLM reply, or the stripped
+    reply itself when it is not fenced.
+    """
+    match = _FENCE_RE.search(llm_output)
+    return match.group(1) if match else llm_output.strip()
+
 def normalize_number(number):
-    return number.lower().replace('whatsapp:', '').strip()
+    # Twilio only ever sends the channel as a prefix, so slice it off instead of scanning for it
+    number = number.strip()
+    # Twilio sends the prefix lowercase; only other casings need the slice to be lowered
+    if number.startswith('whatsapp:') or number[:9].lower() == 'whatsapp:':
+        number = number[9:].lstrip()
+    return number.lower()
 
 def parse_llm_json_output(llm_output: str) -> dict:
     """
     Parses LLM output containing JSON within markdown code blocks into a Python dictionary.
     """
-    clean_json = (
-        llm_output
-        .replace('```json', '')
-        .replace('```', '')
-        .strip()
-    )
+    clean_json = _extract_json_payload(llm_output)
 
     try:
-        data = json.loads(clean_json)
+        data = _json_loads(clean_json)
         return {
             "time_slots": data.get("time_slots", []),
             "timezone": data.get("timezone", "UTC")
@@ -40,20 +74,34 @@ def parse_llm_json_output(llm_output: str) -> dict:
         logger.error(f"Failed to parse JSON: {e}")
         return {"time_slots": [], "timezone": "UTC"}
     
-def extract_slots_and_timezone(message, phone_number, participant_history, meeting_duration):
+@lru_cache(maxsize=None)
+def _get_llm(model: str, temperature: float) -> ChatGoogleGenerativeAI:
     """
-    Extracts time slots and timezone from the participant's message, utilizing the participant's conversation history for context only.
-    Handles multiple timezone patterns and ISO time format conversion.
+    Returns a shared ChatGoogleGenerativeAI client per (model, temperature). The client is
+    thread-safe and pools its HTTP connections, so the extraction chains reuse it across calls.
     """
+    return ChatGoogleGenerativeAI(
+        model=model,
+        temperature=temperature,
+    )
+
+# The extraction chains only ever want the single most likely JSON answer; sampling at
+# temperature 0 keeps replies short and makes repeated inputs give repeatable results
+_llm_model = _get_llm("gemini-1.5-flash", 0)
 
-    current_date = datetime.now(timezone.utc)
 
+def _build_slots_prompt() -> PromptTemplate:
+    """
+    Builds the slot extraction prompt. None of its examples depend on the input, so it is
+    built once at import; meeting_duration is a template variable rather than inlined.
+    """
     json1 = """```json
     {{
       "time_slots": [
         {{
           "start_time": "YYYY-MM-DDTHH:MM:SS",
-          "end_time": "YYYY-MM-DDTHH:MM:SS"
+          "end_time": "YYYY-MM-DDTHH:MM:SS",
+          "gap_minutes": 0
         }},
         ...
       ],
@@ -80,16 +128,11 @@ Act as an expert natural language processor specializing in date and time extrac
    - Detect if the user message indicates confirmation (e.g., "yes," "yeah that works," "that works for me") and check the conversation history to identify what the confirmation refers to.
    - If the confirmation pertains to a previously suggested time slot, assign the confirmed time and include it in the extracted results.
 
-3. **Split Time Slots for Multiple Interviewees**:
-   - If a time range is provided that is longer than the meeting duration, split the time range into multiple slots of the meeting duration. For example, if the user provides a slot "1 PM to 3 PM" and the meeting time is 60 minutes, extract two separate slots: "1 PM to 2 PM" and "2 PM to 3 PM."
+3. **Keep Time Ranges Whole**:
+   - If a time range is provided that is longer than the meeting duration, return it as a single slot covering the whole range. Do not split it into meeting-length slots; that is done after extraction. For example, if the user provides "1 PM to 3 PM", extract one slot from 1 PM to 3 PM.
 
 4. **Handle Gaps Between Interviewees**:
-   - If the message includes a gap between slots (e.g., "with gaps of 30 minutes between each interviewee"), extract multiple time slots with the specified gap. For example, if the user provides "10 AM to 10 PM with gaps of 30 minutes" and the meeting duration is 60 minutes, generate slots like:
-     - "10:00 AM to 11:00 AM"
-     - Break for 30 minutes
-     - "11:30 AM to 12:30 PM"
-     - Break for 30 minutes
-     - And so on until the end of the provided time range.
+   - If the message includes a gap between slots (e.g., "with gaps of 30 minutes between each interviewee"), set `gap_minutes` on the range it applies to. For example, "10 AM to 10 PM with gaps of 30 minutes" is one slot from 10 AM to 10 PM with `gap_minutes` set to 30. Omit `gap_minutes` when no gap is mentioned.
 
 5. **Output Results**:
    - Provide all extracted time slots, inferred timezones, and confirmed times (if applicable) in a well-structured JSON format. Ensure the output is in English and can be easily parsed with the `json` Python library.
@@ -105,7 +148,7 @@ Act as an expert natural language processor specializing in date and time extrac
 - Ensure that vague expressions like "second half of the day" or "after midnight" result in an empty JSON data structure (`{json2}`).
 - Convert all extracted times to a standard timestamp format (ISO 8601).
 - Handle cases where only a start time is provided by setting `end_time` to "unspecified."
-- If there are multiple slots in a range, split the time range into distinct slots, ensuring no overlap, and respecting the provided meeting duration.
+- Return each time range as one slot, even when it spans several meetings; never split ranges yourself.
 - If the message indicates confirmation, cross-reference it with the **Participant's Conversation History** to identify the confirmed time slot and include it as `confirmed_time`.
 
 ## Output Format
@@ -113,7 +156,7 @@ Act as an expert natural language processor specializing in date and time extrac
 {json1}
 ```
 ### Output JSON Structure:
-- `time_slots`: A list of objects with `start_time` and `end_time` for each slot.
+- `time_slots`: A list of objects with `start_time` and `end_time` for each slot or range, plus `gap_minutes` when a gap between meetings was requested.
 - `timezone`: A string indicating the inferred timezone or "unspecified" if not provided.
 - `confirmed_time`: The confirmed time slot, if applicable, structured as an object with `start_time` and `end_time`. If no confirmation is detected, this field is absent.
 
@@ -138,7 +181,7 @@ Provide clear, reliable, and accurate information for scheduling purposes.
 
 Input
 Meeting Duration(in minutes)
-{meeting_duration} minutes
+{{meeting_duration}} minutes
 
 Current_time (in UTC)
 {{current_date}}
@@ -151,63 +194,119 @@ User's Number
 
 Participant's Conversation History
 {{participant_history}} """
-    
-    
-
 
-    llm_model = ChatGoogleGenerativeAI(
-        model="gemini-1.5-flash",
-        temperature=0.7,
-    )
-
-    prompt_template = PromptTemplate(
-        input_variables=['message', 'current_date', 'phone_number', 'participant_history'],
+    return PromptTemplate(
+        input_variables=['message', 'current_date', 'phone_number', 'participant_history', 'meeting_duration'],
         template=PROMPT_TEMPLATE
     )
 
-    chain = prompt_template | llm_model
+_SLOTS_CHAIN = _build_slots_prompt() | _llm_model
+
+def extract_slots_and_timezone(message, phone_number, participant_history, meeting_duration):
+    """
+    Extracts time slots and timezone from the participant's message, utilizing the participant's conversation history for context only.
+    Handles multiple timezone patterns and ISO time format conversion.
+    """
 
-    response = chain.invoke({
+    current_date = datetime.now(timezone.utc)
+
+    response = _SLOTS_CHAIN.invoke({
         'message': message,
         'current_date': current_date,
         'phone_number': phone_number,
-        'participant_history': participant_history
+        'participant_history': participant_history,
+        'meeting_duration': meeting_duration
     })
 
     logger.info(f"extract_slots_and_timezone: {response.content}")
 
     # Parse the LLM output directly into the required format
-    return parse_llm_json_output(response.content)
+    result = parse_llm_json_output(response.content)
+    result['time_slots'] = expand_slots(result['time_slots'], meeting_duration)
+    return result
+
+
+def _parse_slot_time(value: str) -> datetime:
+    # fromisoformat only accepts the 'Z' suffix from Python 3.11 on
+    return datetime.fromisoformat(value[:-1] + '+00:00' if value.endswith('Z') else value)
+
+# Upper bound on the slots a single extraction expands to; a wide range with a short meeting
+# duration would otherwise yield thousands of slots
+MAX_EXPANDED_SLOTS = 100
 
+def expand_slots(time_slots: list, meeting_duration, max_slots: int = MAX_EXPANDED_SLOTS) -> list:
+    """
+    Splits each extracted time range into back-to-back slots of the meeting duration,
+    leaving gap_minutes between consecutive slots. The LLM returns ranges whole, since
+    enumerating every slot itself costs output tokens linearly in the range length.
+    Ranges no longer than one meeting, and slots without a usable end time, are kept as they are.
+    Negative gaps count as zero, and at most max_slots slots are returned.
+    """
+    try:
+        duration = timedelta(minutes=int(meeting_duration))
+    except (TypeError, ValueError):
+        return time_slots[:max_slots]
+    if duration <= timedelta(0):
+        return time_slots[:max_slots]
+
+    expanded = []
+    for slot in time_slots:
+        if len(expanded) >= max_slots:
+            break
+        try:
+            start = _parse_slot_time(slot["start_time"])
+            end = _parse_slot_time(slot["end_time"])
+            gap = timedelta(minutes=max(int(slot.get("gap_minutes") or 0), 0))
+        except (KeyError, TypeError, ValueError, AttributeError):
+            expanded.append(slot)
+            continue
+
+        if end - start <= duration:
+            expanded.append({"start_time": slot["start_time"], "end_time": slot["end_time"]})
+            continue
+
+        # duration is positive and gap is not negative, so every step moves forward
+        step = duration + gap
+        current = start
+        while current + duration <= end and len(expanded) < max_slots:
+            expanded.append({
+                "start_time": current.isoformat(),
+                "end_time": (current + duration).isoformat()
+            })
+            current += step
+    return expanded
 
 def convert_slots_to_utc(slots):
     """
     Helper method to convert each time slot from local time to UTC.
     """
-    timezone_str = slots.get('timezone', 'UTC')
-    try:
-        timezone = pytz.timezone(timezone_str)
-    except pytz.UnknownTimeZoneError:
-        logger.error(f"Unknown timezone: {timezone_str}. Defaulting to UTC.")
-        timezone = pytz.UTC
+    timezone = get_timezone(slots.get('timezone', 'UTC'))
 
     slots_utc = {"time_slots": []}
 
+    # Ranges split into back-to-back slots share boundaries (one slot's end is the next
+    # one's start), so each distinct timestamp is parsed and converted once per call
+    converted = {}
+    utc = pytz.UTC
+
+    def to_utc(value: str) -> datetime:
+        result = converted.get(value)
+        if result is None:
+            parsed = _parse_slot_time(value)
+            if parsed.tzinfo is None:  # Only localize if naive
+                parsed = timezone.localize(parsed)
+            # Aware UTC values are already in the target zone
+            result = converted[value] = parsed if parsed.tzinfo is utc else parsed.astimezone(utc)
+        return result
+
     for slot in slots.get("time_slots", []):
         try:
             # Parse and handle start time
-            start = datetime.fromisoformat(slot["start_time"])
-            if start.tzinfo is None:  # Only localize if naive
-                start = timezone.localize(start)
-            start_utc = start.astimezone(pytz.UTC)
+            start_utc = to_utc(slot["start_time"])
 
             # Parse and handle end time
-            end = None
             if slot.get("end_time") and slot["end_time"].lower() != "unspecified":
-                end = datetime.fromisoformat(slot["end_time"])
-                if end.tzinfo is None:  # Only localize if naive
-                    end = timezone.localize(end)
-                end_utc = end.astimezone(pytz.UTC)
+                end_utc = to_utc(slot["end_time"])
             else:
                 end_utc = start_utc + timedelta(hours=1)  # Default end time if unspecified
 
@@ -226,23 +325,18 @@ def parse_llm_json_timezone(llm_output: str) -> dict:
     """
     Parses LLM output containing JSON within markdown code blocks into a Python dictionary.
     """
-    clean_json = (
-        llm_output
-        .replace('```json', '')
-        .replace('```', '')
-        .strip()
-    )
+    clean_json = _extract_json_payload(llm_output)
 
     try:
-        data = json.loads(clean_json)
+        data = _json_loads(clean_json)
         return data
     except json.JSONDecodeError as e:
         logger.error(f"Failed to parse JSON: {e}")
         return {}
 
-def extract_timezone_from_number(phone_number: str) -> str:
+def _build_timezone_from_number_prompt() -> PromptTemplate:
     """
-    Uses LLM to infer the timezone from the phone number.
+    Builds the prompt inferring a timezone from a phone number, once at import.
     """
     json1="""
         {{
@@ -263,7 +357,7 @@ def extract_timezone_from_number(phone_number: str) -> str:
     PROMPT_TEMPLATE = f"""
 You are an expert assistant that helps infer the timezone of a user based on their phone number.
 
-Given the following phone number: {phone_number}, determine the most likely timezone of the user.
+Given the following phone number: {{phone_number}}, determine the most likely timezone of the user.
 
 Provide your answer in the following JSON format:
 
@@ -286,20 +380,42 @@ Now, determine the timezone for the following phone number.
 
 Phone number: {{phone_number}} """
 
-    # Instantiate LLM model
-    llm_model = ChatGoogleGenerativeAI(
-        model="gemini-1.5-flash",
-        temperature=0.7,
-    )
-
-    prompt_template = PromptTemplate(
+    return PromptTemplate(
         input_variables=['phone_number'],
         template=PROMPT_TEMPLATE
     )
 
-    chain = prompt_template | llm_model
+_TIMEZONE_FROM_NUMBER_CHAIN = _build_timezone_from_number_prompt() | _llm_model
+
+def _timezone_from_number_offline(phone_number: str):
+    """
+    Looks the timezone up in phonenumbers' metadata. Returns None if phonenumbers is not
+    installed, the number cannot be parsed, or it maps to more than one timezone.
+    """
+    if phonenumbers is None:
+        return None
+    try:
+        parsed = phonenumbers.parse(phone_number, None)
+    except phonenumbers.NumberParseException:
+        return None
+    zones = phonenumbers_timezone.time_zones_for_number(parsed)
+    if len(zones) == 1 and zones[0] != 'Etc/Unknown':
+        return zones[0]
+    return None
+
+@lru_cache(maxsize=4096)
+def extract_timezone_from_number(phone_number: str) -> str:
+    """
+    Infers the timezone from the phone number. Numbers whose country/area code pins down a
+    single timezone are resolved locally; the rest are sent to the LLM. Results are memoized
+    per number, since a participant's number is looked up again on every timezone check.
+    """
+    timezone = _timezone_from_number_offline(phone_number)
+    if timezone:
+        logger.info(f"timezone:{timezone}")
+        return timezone
 
-    response = chain.invoke({
+    response = _TIMEZONE_FROM_NUMBER_CHAIN.invoke({
         'phone_number': phone_number
     })
 
@@ -310,8 +426,10 @@ Phone number: {{phone_number}} """
     logger.info(f"timezone:{timezone}")
     return timezone
 
-def extract_city_from_message(message: str) -> str:
-    """ Uses LLM to extract the city from the user's message. """ 
+def _build_city_prompt() -> PromptTemplate:
+    """
+    Builds the prompt extracting a city from a message, once at import.
+    """
     json1 = """
 {{
   "city": "City Name"
@@ -357,19 +475,16 @@ Now, extract the city from the following message:
 
 Message: {{message}} """
 
-    llm_model = ChatGoogleGenerativeAI(
-        model="gemini-1.5-flash",
-        temperature=0.5,
-    )
-
-    prompt_template = PromptTemplate(
+    return PromptTemplate(
         input_variables=['message'],
         template=PROMPT_TEMPLATE
     )
 
-    chain = prompt_template | llm_model
+_CITY_CHAIN = _build_city_prompt() | _llm_model
 
-    response = chain.invoke({
+def extract_city_from_message(message: str) -> str:
+    """ Uses LLM to extract the city from the user's message. """ 
+    response = _CITY_CHAIN.invoke({
         'message': message
     })
 
@@ -380,11 +495,10 @@ Message: {{message}} """
     logger.info(f"city: {city}")
     return city
 
-def extract_timezone_from_city(city: str) -> str: 
-    """ Uses LLM to infer the timezone from the city name. """ 
-    if city.lower() == 'unspecified' or not city.strip(): 
-        return 'unspecified'
-    
+def _build_timezone_from_city_prompt() -> PromptTemplate:
+    """
+    Builds the prompt inferring a timezone from a city name, once at import.
+    """
     json1 = """
 {{
   "timezone": "Continent/City"
@@ -425,19 +539,20 @@ City: London Output:
 Now, determine the timezone for the following city:
 
 City: {{city}} """
-    llm_model = ChatGoogleGenerativeAI(
-        model="gemini-1.5-flash",
-        temperature=0.7,
-    )
 
-    prompt_template = PromptTemplate(
+    return PromptTemplate(
         input_variables=['city'],
         template=PROMPT_TEMPLATE
     )
 
-    chain = prompt_template | llm_model
+_TIMEZONE_FROM_CITY_CHAIN = _build_timezone_from_city_prompt() | _llm_model
 
-    response = chain.invoke({
+def extract_timezone_from_city(city: str) -> str: 
+    """ Uses LLM to infer the timezone from the city name. """ 
+    if city.lower() == 'unspecified' or not city.strip(): 
+        return 'unspecified'
+
+    response = _TIMEZONE_FROM_CITY_CHAIN.invoke({
         'city': city
     })
 
@@ -448,6 +563,17 @@ City: {{city}} """
     logger.info(f"timezone:{timezone}")
     return timezone
 
+# Emojis and various symbol ranges stripped from user messages, compiled once
+_EMOJI_RE = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"  # Emoticons
+    "\U0001F300-\U0001F5FF"  # Symbols & Pictographs
+    "\U0001F680-\U0001F6FF"  # Transport & Map Symbols
+    "\U0001F1E0-\U0001F1FF"  # Flags
+    "]+",
+    flags=re.UNICODE
+)
+
 def sanitize_message(message: str) -> str:
     """
     Sanitizes the user message by removing special characters and emojis.
@@ -458,25 +584,19 @@ def sanitize_message(message: str) -> str:
     Returns:
         str: The sanitized message with emojis and non-printable characters removed.
     """
-    # Define a regex pattern to match emojis and various symbol ranges
-    emoji_pattern = re.compile(
-        "[" 
-        "\U0001F600-\U0001F64F"  # Emoticons
-        "\U0001F300-\U0001F5FF"  # Symbols & Pictographs
-        "\U0001F680-\U0001F6FF"  # Transport & Map Symbols
-        "\U0001F1E0-\U0001F1FF"  # Flags
-        "]+", 
-        flags=re.UNICODE
-    )
-    
     # Remove emojis using the regex pattern
-    message = emoji_pattern.sub(r'', message)
+    message = _EMOJI_RE.sub('', message)
     
-    # Remove other non-printable characters
-    message = ''.join(filter(lambda x: x.isprintable(), message))
+    # Remove other non-printable characters; str.isprintable() scans in C, so the
+    # per-character filter only runs for the rare message that actually needs it
+    if not message.isprintable():
+        message = ''.join(filter(str.isprintable, message))
     
     return message
 
+# Human-readable local time used in every prompt and notice, e.g. 'Monday, March 03, 2025 at 02:30 PM EST'
+LOCAL_TIME_FORMAT = '%A, %B %d, %Y at %I:%M %p %Z'
+
 def get_localized_current_time(timezone_str: str) -> str:
     """
     Returns the current time localized to the specified timezone.
@@ -487,11 +607,12 @@ def get_localized_current_time(timezone_str: str) -> str:
     Returns:
         str: Formatted current time in the specified timezone.
     """
-    try:
-        tz = pytz.timezone(timezone_str)
-    except pytz.UnknownTimeZoneError:
-        logger.error(f"Unknown timezone: {timezone_str}. Defaulting to UTC.")
-        tz = pytz.UTC
-    localized_time = datetime.now(tz).strftime('%A, %B %d, %Y at %I:%M %p %Z')
+    # Handlers ask for this several times per message; the formatted value only changes
+    # once a minute, so it is memoized per timezone and second.
+    return _localized_time_at(timezone_str, int(time.time()))
+
+@lru_cache(maxsize=64)
+def _localized_time_at(timezone_str: str, epoch_second: int) -> str:
+    localized_time = datetime.fromtimestamp(epoch_second, get_timezone(timezone_str)).strftime(LOCAL_TIME_FORMAT)
     logger.info(f"localized_time:{localized_time}")
     return localized_time
\ No newline at end of file
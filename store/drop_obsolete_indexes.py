@@ -0,0 +1,56 @@
+# drop_obsolete_indexes.py
+
+"""
+One-off migration dropping MongoDB indexes that earlier versions created and no query
+uses any more; each one still costs every write. Run it once per database with
+
+    python -m store.drop_obsolete_indexes
+
+It reads MONGODB_URI and MONGODB_DB_NAME from the environment (or .env), like app.py.
+Indexes that are already gone are skipped, so running it again is harmless.
+"""
+
+import logging
+import os
+from dotenv import load_dotenv
+from store.mongodb_handler import get_client
+
+logger = logging.getLogger(__name__)
+
+# (collection, index name) pairs superseded by the indexes MongoDBHandler creates
+OBSOLETE_INDEXES = [
+    # Replaced by the (conversation_id, resolved) compound index
+    ('attention_flags', 'conversation_id_1'),
+    # Replaced by the partial (resolved, created_at) index
+    ('attention_flags', 'resolved_1'),
+    # Number lookups go through participant_numbers
+    ('conversations', 'interviewer.number_1'),
+    ('conversations', 'interviewees.number_1'),
+]
+
+def drop_obsolete_indexes(db) -> int:
+    """
+    Drops the obsolete indexes that exist in the given database.
+
+    Returns:
+        int: The number of indexes dropped.
+    """
+    dropped = 0
+    for collection_name, index_name in OBSOLETE_INDEXES:
+        collection = db[collection_name]
+        try:
+            if index_name not in collection.index_information():
+                continue
+            collection.drop_index(index_name)
+        except Exception as e:
+            logger.error("Error dropping MongoDB index %s on %s: %s", index_name, collection_name, e)
+            continue
+        dropped += 1
+        logger.info("Dropped obsolete MongoDB index %s on %s.", index_name, collection_name)
+    return dropped
+
+if __name__ == "__main__":
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO)
+    db = get_client(os.getenv("MONGODB_URI"))[os.getenv("MONGODB_DB_NAME")]
+    logger.info("Dropped %s obsolete MongoDB indexes.", drop_obsolete_indexes(db))
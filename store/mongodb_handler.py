@@ -1,13 +1,134 @@
 # mongodb_handler.py
 
-from pymongo import MongoClient
-from datetime import datetime
-import pytz
+from pymongo import MongoClient, ReturnDocument, has_c as pymongo_has_c
+from bson import decode as bson_decode, has_c as bson_has_c
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+from collections import OrderedDict
+from datetime import datetime, timezone
+import atexit
+import functools
+import inspect
 import logging
-from typing import Optional, Dict, Any, List
+import threading
+import time
+from typing import Optional, Dict, Any, List, Iterator, Callable
 
 logger = logging.getLogger(__name__)
 
+# Without its C extensions pymongo falls back to pure-Python BSON encoding and decoding,
+# which is several times slower on documents carrying full conversation histories
+if not (bson_has_c() and pymongo_has_c()):
+    logger.warning(
+        "pymongo C extensions are not available (bson: %s, pymongo: %s); BSON handling will be slow. "
+        "Install a pymongo wheel built for this platform.", bson_has_c(), pymongo_has_c()
+    )
+
+# One MongoClient per URI for the whole process. Each client owns a connection pool and
+# monitor threads, so handlers and modules talking to the same cluster share it.
+_clients: Dict[str, MongoClient] = {}
+_clients_lock = threading.Lock()
+
+# Short-lived cache of conversation documents, for read-only lookups made while handling
+# one message. Writes through the handler invalidate it; reads opt in with cached=True.
+CONVERSATION_CACHE_TTL = 5  # seconds
+CONVERSATION_CACHE_SIZE = 1024
+
+# Default projections for list lookups whose callers never need the participants' histories
+_ACTIVE_CONVERSATION_PROJECTION = {'conversation_id': 1, 'status': 1, 'interviewer.number': 1, 'interviewees.number': 1}
+_FLAG_PROJECTION = {'_id': 0}
+
+# Documents fetched per cursor round trip by the streaming readers. Larger batches mean
+# fewer round trips; smaller ones bound the memory held per batch and the first-document latency.
+DEFAULT_BATCH_SIZE = 500
+
+# Aggregation stage returning _id as a string, for documents handed straight to jsonify
+_STRINGIFY_ID_STAGE = {'$addFields': {'_id': {'$toString': '$_id'}}}
+_UNRESOLVED_FLAGS_PIPELINE = [{'$match': {'resolved': False}}, _STRINGIFY_ID_STAGE]
+_COMPLETED_CONVERSATIONS_PIPELINE = [{'$match': {'status': 'completed'}}, _STRINGIFY_ID_STAGE]
+
+def get_client(uri: str) -> MongoClient:
+    """
+    Returns the shared MongoClient for the given URI, creating it on first use.
+    
+    Args:
+        uri (str): The MongoDB connection URI.
+    
+    Returns:
+        MongoClient: The process-wide client for that URI.
+    """
+    with _clients_lock:
+        client = _clients.get(uri)
+        if client is None:
+            # Scheduling bursts fan out across threads (background sends, calendar writes),
+            # so allow more pooled connections than the default before callers queue
+            client = _clients[uri] = MongoClient(uri, maxPoolSize=50)
+        return client
+
+@atexit.register
+def _close_clients() -> None:
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
+# Query fragments that never vary, built once; pymongo only reads query documents
+_FIELD_MISSING = {'$exists': False}
+
+# Fills participant_numbers on conversations created before the field existed, so number
+# lookups can rely on it alone
+_PARTICIPANT_NUMBERS_BACKFILL = [
+    {'$set': {'participant_numbers': {
+        '$concatArrays': [['$interviewer.number'], {'$ifNull': ['$interviewees.number', []]}]
+    }}}
+]
+
+def _mongo_op(label: str, key: Optional[str] = 'conversation_id', reraise: bool = True,
+              default: Optional[Callable[[], Any]] = None):
+    """
+    Logs any exception from the wrapped handler method and re-raises it, in place of a
+    try/except in every accessor. Generator methods are covered while they are iterated.
+
+    Args:
+        label (str): Describes the operation in the error log, e.g. "retrieving conversation"
+        key (Optional[str]): The argument identifying the target in the log. Only this argument is
+            logged, never phone numbers or document bodies; None logs no argument
+        reraise (bool): If False the error is only logged and the method returns default()
+        default (Optional[Callable[[], Any]]): Builds the return value when not re-raising
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        def log_error(args, kwargs, e):
+            target = signature.bind_partial(*args, **kwargs).arguments.get(key) if key else None
+            if target is None:
+                logger.error("Error %s: %s", label, e)
+            else:
+                logger.error("Error %s for %s %s: %s", label, key, target, e)
+
+        if inspect.isgeneratorfunction(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                try:
+                    yield from func(*args, **kwargs)
+                except Exception as e:
+                    log_error(args, kwargs, e)
+                    if reraise:
+                        raise
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    log_error(args, kwargs, e)
+                    if reraise:
+                        raise
+                    return default() if default else None
+        return wrapper
+    return decorator
+
 class MongoDBHandler:
     def __init__(self, uri: str, db_name: str):
         """
@@ -17,69 +138,191 @@ class MongoDBHandler:
             uri (str): The MongoDB connection URI.
             db_name (str): The name of the database to use.
         """
-        self.client = MongoClient(uri)
+        self.client = get_client(uri)
         self.db = self.client[db_name]
         self.conversations = self.db.conversations
         self.attention_flags = self.db.attention_flags  # New collection for attention flags
+        # Cached conversations are kept as raw BSON and decoded per read, so every caller
+        # still gets its own dict to mutate
+        self._raw_conversations = self.conversations.with_options(
+            codec_options=CodecOptions(document_class=RawBSONDocument)
+        )
+        self._conversation_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._conversation_cache_lock = threading.Lock()
+        # Bumped on every invalidation, so a read that raced with a write is not cached
+        self._conversation_cache_generation = 0
+        self._ensure_indexes()
+        self._backfill_participant_numbers()
+
+    def _ensure_indexes(self) -> None:
+        """
+        Creates the indexes backing the handler's lookups. create_index is a no-op for indexes
+        that already exist, so this is safe to run on every start. Each index is handled on its
+        own and a failure is logged rather than raised, since the queries still work either way.
+        Indexes earlier versions created are dropped by store/drop_obsolete_indexes.py.
+        """
+        indexes = [
+            # Every conversation read and interviewee update pins one document by conversation_id
+            (self.conversations, [('conversation_id', 1)], {'unique': True}),
+            # Number lookups
+            (self.conversations, [('participant_numbers', 1)], {}),
+            # Status listings, and an interviewer's active conversations
+            (self.conversations, [('status', 1), ('interviewer.number', 1)], {}),
+            # Range scan for delete_conversations_past_scheduled_time
+            (self.conversations, [('interviewees.scheduled_slot.end_time', 1)], {}),
+            # Flags by conversation, with or without a resolution filter, and resolution by id
+            (self.attention_flags, [('conversation_id', 1), ('resolved', 1)], {}),
+            (self.attention_flags, [('id', 1)], {'unique': True}),
+            # The unresolved-flag listing; resolved flags are left out of this partial index
+            (self.attention_flags, [('resolved', 1), ('created_at', -1)], {'partialFilterExpression': {'resolved': False}}),
+        ]
+        for collection, keys, options in indexes:
+            self._create_index(collection, keys, options)
+
+    @_mongo_op("creating MongoDB index", key='keys', reraise=False)
+    def _create_index(self, collection, keys: List[tuple], options: Dict[str, Any]) -> None:
+        collection.create_index(keys, **options)
+
+    @_mongo_op("backfilling participant_numbers", key=None, reraise=False)
+    def _backfill_participant_numbers(self) -> None:
+        """
+        Sets participant_numbers on conversations that predate it. Once every document has the
+        field this matches nothing, so it is cheap to run on every start. A failure is logged
+        rather than raised, like an index that could not be created.
+        """
+        result = self.conversations.update_many(
+            {'participant_numbers': _FIELD_MISSING}, _PARTICIPANT_NUMBERS_BACKFILL
+        )
+        if result.modified_count:
+            logger.info("Backfilled participant_numbers on %s conversations.", result.modified_count)
+
+    @classmethod
+    def close_all(cls) -> None:
+        """
+        Closes every shared MongoClient, e.g. in test tear-down. Handlers created afterwards
+        open fresh clients; existing handlers must not be used after this.
+        """
+        _close_clients()
 
     # ------------------ Conversation Methods ------------------
 
+    @_mongo_op("inserting conversation into MongoDB", key=None)
     def create_conversation(self, conversation_data: Dict[str, Any]) -> None:
         """
-        Inserts a new conversation document into the database.
+        Inserts a new conversation document into the database. Participants' numbers are
+        denormalized into participant_numbers for the number lookups; they never change
+        after creation.
         
         Args:
             conversation_data (Dict[str, Any]): The conversation data to insert.
         """
-        try:
-            self.conversations.insert_one(conversation_data)
-            logger.info(f"Conversation {conversation_data['conversation_id']} inserted into MongoDB.")
-        except Exception as e:
-            logger.error(f"Error inserting conversation into MongoDB: {e}")
-            raise
+        if 'participant_numbers' not in conversation_data:
+            conversation_data['participant_numbers'] = [
+                conversation_data['interviewer']['number'],
+                *(ie['number'] for ie in conversation_data.get('interviewees', []))
+            ]
+        self.conversations.insert_one(conversation_data)
+        self._invalidate_conversation(conversation_data['conversation_id'])
+        logger.info("Conversation %s inserted into MongoDB.", conversation_data['conversation_id'])
+
+    def _invalidate_conversation(self, conversation_id: Optional[str] = None) -> None:
+        """
+        Drops a conversation from the read cache, or every conversation if no id is given.
+        """
+        with self._conversation_cache_lock:
+            self._conversation_cache_generation += 1
+            if conversation_id is None:
+                self._conversation_cache.clear()
+            else:
+                self._conversation_cache.pop(conversation_id, None)
 
-    def get_conversation(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+    @_mongo_op("retrieving conversation from MongoDB")
+    def get_conversation(self, conversation_id: str, projection: Optional[Dict[str, Any]] = None,
+                         cached: bool = False) -> Optional[Dict[str, Any]]:
         """
-        Retrieves a conversation document by conversation_id.
+        Retrieves a conversation document by conversation_id. Full documents read from MongoDB
+        are kept in a short-lived cache (CONVERSATION_CACHE_TTL seconds) that writes through this
+        handler invalidate; writes from other processes are not seen there, so only read-only
+        paths within a single request opt into it.
         
         Args:
             conversation_id (str): The unique identifier of the conversation.
+            projection (Optional[Dict[str, Any]], optional): Fields to return, for callers that only need part of the document. Defaults to None (all fields).
+            cached (bool, optional): Serve the document from the cache if it is there, for callers that only read it for context. Defaults to False.
         
         Returns:
             Optional[Dict[str, Any]]: The conversation document if found, else None.
         """
-        try:
-            conversation = self.conversations.find_one({'conversation_id': conversation_id})
-            if conversation:
-                logger.info(f"Conversation {conversation_id} retrieved from MongoDB.")
-            else:
-                logger.warning(f"Conversation {conversation_id} not found in MongoDB.")
-            return conversation
-        except Exception as e:
-            logger.error(f"Error retrieving conversation from MongoDB: {e}")
-            raise
+        if projection is not None:
+            conversation = self.conversations.find_one({'conversation_id': conversation_id}, projection)
+        else:
+            conversation = self._get_conversation_cached(conversation_id, cached)
+        if conversation:
+            logger.info("Conversation %s retrieved from MongoDB.", conversation_id)
+        else:
+            logger.warning("Conversation %s not found in MongoDB.", conversation_id)
+        return conversation
+
+    def _get_conversation_cached(self, conversation_id: str, cached: bool) -> Optional[Dict[str, Any]]:
+        now = time.monotonic()
+        raw = None
+        with self._conversation_cache_lock:
+            generation = self._conversation_cache_generation
+            entry = self._conversation_cache.get(conversation_id) if cached else None
+            if entry and entry[0] > now:
+                raw = entry[1]
+        if raw is None:
+            document = self._raw_conversations.find_one({'conversation_id': conversation_id})
+            if document is None:
+                return None
+            raw = document.raw
+            with self._conversation_cache_lock:
+                if generation == self._conversation_cache_generation:
+                    self._conversation_cache[conversation_id] = (now + CONVERSATION_CACHE_TTL, raw)
+                    self._conversation_cache.move_to_end(conversation_id)
+                    if len(self._conversation_cache) > CONVERSATION_CACHE_SIZE:
+                        self._conversation_cache.popitem(last=False)
+        return bson_decode(raw, codec_options=self.conversations.codec_options)
+
+    @_mongo_op("retrieving conversations from MongoDB", key='status')
+    def iter_conversations(self, status: Optional[str] = None, projection: Optional[Dict[str, Any]] = None,
+                           batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Dict[str, Any]]:
+        """
+        Yields conversation documents, optionally filtered by status. Documents are streamed
+        from the cursor in batches rather than loaded into a list up front.
+        
+        Args:
+            status (Optional[str], optional): The status to filter conversations by (e.g., 'active', 'completed'). Defaults to None.
+            projection (Optional[Dict[str, Any]], optional): Fields to return. Defaults to None (all fields).
+            batch_size (int, optional): Number of documents fetched per round trip. Defaults to DEFAULT_BATCH_SIZE.
+        
+        Yields:
+            Dict[str, Any]: A conversation document.
+        """
+        query = {}
+        if status:
+            query['status'] = status
+        count = 0
+        for conversation in self.conversations.find(query, projection).batch_size(batch_size):
+            count += 1
+            yield conversation
+        logger.info("Retrieved %s conversations from MongoDB with status='%s'.", count, status)
 
-    def get_all_conversations(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+    def get_all_conversations(self, status: Optional[str] = None, projection: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
-        Retrieves all conversation documents, optionally filtered by status.
+        Retrieves all conversation documents, optionally filtered by status. Prefer
+        iter_conversations when the documents are only iterated once.
         
         Args:
             status (Optional[str], optional): The status to filter conversations by (e.g., 'active', 'completed'). Defaults to None.
+            projection (Optional[Dict[str, Any]], optional): Fields to return. Defaults to None (all fields).
         
         Returns:
             List[Dict[str, Any]]: A list of conversation documents.
         """
-        try:
-            query = {}
-            if status:
-                query['status'] = status
-            conversations = list(self.conversations.find(query))
-            logger.info(f"Retrieved {len(conversations)} conversations from MongoDB with status='{status}'.")
-            return conversations
-        except Exception as e:
-            logger.error(f"Error retrieving conversations from MongoDB: {e}")
-            raise
+        return list(self.iter_conversations(status=status, projection=projection))
 
+    @_mongo_op("updating conversation in MongoDB")
     def update_conversation(self, conversation_id: str, update_data: Dict[str, Any], filter_data: Optional[Dict[str, Any]] = None) -> None:
         """
         Updates a conversation document with new data.
@@ -90,22 +333,139 @@ class MongoDBHandler:
             update_data (Dict[str, Any]): The data to update in the conversation.
             filter_data (Optional[Dict[str, Any]], optional): Additional filter criteria. Defaults to None.
         """
-        try:
-            if filter_data:
-                query = {'conversation_id': conversation_id}
-                query.update(filter_data)
-            else:
-                query = {'conversation_id': conversation_id}
-            
-            result = self.conversations.update_one(query, {'$set': update_data})
-            if result.matched_count:
-                logger.info(f"Conversation {conversation_id} updated in MongoDB.")
-            else:
-                logger.warning(f"No matching conversation found to update for conversation_id: {conversation_id}.")
-        except Exception as e:
-            logger.error(f"Error updating conversation in MongoDB: {e}")
-            raise
+        if filter_data:
+            query = {'conversation_id': conversation_id}
+            query.update(filter_data)
+        else:
+            query = {'conversation_id': conversation_id}
+        
+        result = self.conversations.update_one(query, {'$set': update_data})
+        self._invalidate_conversation(conversation_id)
+        if result.matched_count:
+            logger.info("Conversation %s updated in MongoDB.", conversation_id)
+        else:
+            logger.warning("No matching conversation found to update for conversation_id: %s.", conversation_id)
 
+    @_mongo_op("updating interviewee in MongoDB")
+    def update_interviewee(self, conversation_id: str, number: str, fields: Dict[str, Any],
+                           update_data: Optional[Dict[str, Any]] = None,
+                           increments: Optional[Dict[str, int]] = None,
+                           expected: Optional[Dict[str, Any]] = None,
+                           filter_data: Optional[Dict[str, Any]] = None,
+                           pulls: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Updates fields of a single interviewee in place. An array filter targets the interviewee
+        by number, so only the given fields of that one sub-document are written instead of the
+        whole interviewees array. Elements are removed from top-level arrays with pulls, so slots
+        other requests reserved in the meantime are left in place.
+        
+        Args:
+            conversation_id (str): The unique identifier of the conversation.
+            number (str): The interviewee's phone number.
+            fields (Dict[str, Any]): The interviewee fields to set.
+            update_data (Optional[Dict[str, Any]], optional): Top-level conversation fields to set in the same write. Defaults to None.
+            increments (Optional[Dict[str, int]], optional): Interviewee counters to increment server-side. Defaults to None.
+            expected (Optional[Dict[str, Any]], optional): Interviewee field values that must still hold for the update to apply. Defaults to None.
+            filter_data (Optional[Dict[str, Any]], optional): Additional conversation filter criteria. Defaults to None.
+            pulls (Optional[Dict[str, Any]], optional): Top-level array fields mapped to the condition of the elements to remove. Defaults to None.
+        
+        Returns:
+            bool: True if the interviewee was modified, False otherwise.
+        """
+        update = {f'interviewees.$[ie].{key}': value for key, value in fields.items()}
+        if update_data:
+            update.update(update_data)
+        operations = {'$set': update}
+        if pulls:
+            operations['$pull'] = pulls
+        if increments:
+            operations['$inc'] = {f'interviewees.$[ie].{key}': value for key, value in increments.items()}
+
+        query = {'conversation_id': conversation_id}
+        if filter_data:
+            query.update(filter_data)
+        array_filter = {'ie.number': number}
+        if expected:
+            array_filter.update({f'ie.{key}': value for key, value in expected.items()})
+
+        result = self.conversations.update_one(query, operations, array_filters=[array_filter])
+        self._invalidate_conversation(conversation_id)
+        if result.modified_count:
+            logger.info("Interviewee %s updated in conversation %s.", number, conversation_id)
+        elif result.matched_count:
+            logger.info("Interviewee %s in conversation %s left unchanged.", number, conversation_id)
+        else:
+            logger.warning("No matching conversation found to update interviewee %s for conversation_id: %s.", number, conversation_id)
+        return bool(result.modified_count)
+
+    @_mongo_op("updating interviewees in MongoDB")
+    def update_interviewees(self, conversation_id: str, numbers: List[str], fields: Dict[str, Any]) -> None:
+        """
+        Sets the same fields on several interviewees in a single write, targeting them by number
+        with an array filter as update_interviewee does.
+        
+        Args:
+            conversation_id (str): The unique identifier of the conversation.
+            numbers (List[str]): The interviewees' phone numbers.
+            fields (Dict[str, Any]): The interviewee fields to set.
+        """
+        if not numbers:
+            return
+        result = self.conversations.update_one(
+            {'conversation_id': conversation_id},
+            {'$set': {f'interviewees.$[ie].{key}': value for key, value in fields.items()}},
+            array_filters=[{'ie.number': {'$in': list(numbers)}}]
+        )
+        self._invalidate_conversation(conversation_id)
+        if result.matched_count:
+            logger.info("%s interviewees updated in conversation %s.", len(numbers), conversation_id)
+        else:
+            logger.warning("No matching conversation found to update interviewees for conversation_id: %s.", conversation_id)
+
+    @_mongo_op("reserving slots in MongoDB")
+    def reserve_slots(self, conversation_id: str, slots: List[Dict[str, Any]], update_data: Optional[Dict[str, Any]] = None,
+                      interviewee_fields: Optional[Dict[str, Dict[str, Any]]] = None) -> bool:
+        """
+        Atomically appends slots to a conversation's reserved_slots, optionally setting other
+        fields in the same write. The update only applies if none of the given slots has been
+        reserved in the meantime, so concurrent workers cannot hand out the same slot twice.
+        
+        Args:
+            conversation_id (str): The unique identifier of the conversation.
+            slots (List[Dict[str, Any]]): The slots to reserve.
+            update_data (Optional[Dict[str, Any]], optional): Additional fields to set. Defaults to None.
+            interviewee_fields (Optional[Dict[str, Dict[str, Any]]], optional): Fields to set per interviewee, keyed by number.
+                Each interviewee is targeted by an array filter, as in update_interviewee. Defaults to None.
+        
+        Returns:
+            bool: True if the reservation was recorded, False if the conversation is missing or a slot was already reserved.
+        """
+        query = {
+            'conversation_id': conversation_id,
+            'reserved_slots.start_time': {'$nin': [slot['start_time'] for slot in slots]}
+        }
+        update = {'$push': {'reserved_slots': {'$each': slots}}}
+        fields_to_set = dict(update_data) if update_data else {}
+        array_filters = []
+        for index, (number, fields) in enumerate((interviewee_fields or {}).items()):
+            fields_to_set.update({f'interviewees.$[ie{index}].{key}': value for key, value in fields.items()})
+            array_filters.append({f'ie{index}.number': number})
+        if fields_to_set:
+            update['$set'] = fields_to_set
+
+        result = self.conversations.find_one_and_update(
+            query, update, projection={'_id': 1}, return_document=ReturnDocument.AFTER,
+            array_filters=array_filters or None
+        )
+        self._invalidate_conversation(conversation_id)
+        if result:
+            logger.info("Reserved %s slots for conversation %s.", len(slots), conversation_id)
+            return True
+        else:
+            logger.warning("Could not reserve slots for conversation %s: conversation missing or slot already reserved.", conversation_id)
+            return False
+
+    @_mongo_op("deleting conversation from MongoDB")
     def delete_conversation(self, conversation_id: str) -> bool:
         """
         Deletes a conversation document by conversation_id, along with its associated attention flags.
@@ -116,118 +476,100 @@ class MongoDBHandler:
         Returns:
             bool: True if deletion was successful, False otherwise.
         """
-        try:
-            # Delete the conversation
-            result = self.conversations.delete_one({'conversation_id': conversation_id})
-            if result.deleted_count > 0:
-                logger.info(f"Conversation {conversation_id} deleted from MongoDB.")
-                
-                # Also delete associated attention flags
-                flags_deleted = self.attention_flags.delete_many({'conversation_id': conversation_id})
-                logger.info(f"Deleted {flags_deleted.deleted_count} attention flags associated with conversation {conversation_id}.")
-                return True
-            else:
-                logger.warning(f"Conversation {conversation_id} not found in MongoDB.")
-                return False
-        except Exception as e:
-            logger.error(f"Error deleting conversation from MongoDB: {e}")
-            raise
+        # Delete the conversation
+        result = self.conversations.delete_one({'conversation_id': conversation_id})
+        self._invalidate_conversation(conversation_id)
+        if result.deleted_count > 0:
+            logger.info("Conversation %s deleted from MongoDB.", conversation_id)
 
+            # Also delete associated attention flags
+            flags_deleted = self.attention_flags.delete_many({'conversation_id': conversation_id})
+            logger.info("Deleted %s attention flags associated with conversation %s.", flags_deleted.deleted_count, conversation_id)
+            return True
+        else:
+            logger.warning("Conversation %s not found in MongoDB.", conversation_id)
+            return False
+
+    @_mongo_op("deleting past conversations from MongoDB", key=None)
     def delete_conversations_past_scheduled_time(self) -> None:
         """
         Deletes conversations where all scheduled times have passed.
         """
-        try:
-            current_time = datetime.now(pytz.UTC).isoformat()
-            result = self.conversations.delete_many({
-                'interviewees': {
-                    '$elemMatch': {
-                        'scheduled_slot.end_time': {'$lt': current_time}
-                    }
+        current_time = datetime.now(timezone.utc).isoformat()
+        result = self.conversations.delete_many({
+            'interviewees': {
+                '$elemMatch': {
+                    'scheduled_slot.end_time': {'$lt': current_time}
                 }
-            })
-            logger.info(f"Deleted {result.deleted_count} conversations past scheduled time from MongoDB.")
-        except Exception as e:
-            logger.error(f"Error deleting past conversations from MongoDB: {e}")
-            raise
+            }
+        })
+        if result.deleted_count:
+            self._invalidate_conversation()
+        logger.info("Deleted %s conversations past scheduled time from MongoDB.", result.deleted_count)
 
-    def find_conversation_by_number(self, number: str) -> Optional[Dict[str, Any]]:
+    @_mongo_op("retrieving conversation by number from MongoDB", key=None)
+    def find_conversation_by_number(self, number: str, projection: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         """
         Finds a single conversation that involves the given phone number, either as an interviewer or interviewee.
         Returns the conversation document if found, otherwise None.
         
         Args:
             number (str): The phone number to search for.
+            projection (Optional[Dict[str, Any]], optional): Fields to return. Defaults to None (all fields).
         
         Returns:
             Optional[Dict[str, Any]]: The conversation document if found, else None.
         """
-        try:
-            conversation = self.conversations.find_one({
-                '$or': [
-                    {'interviewer.number': number},
-                    {'interviewees.number': number}
-                ]
-            })
-            if conversation:
-                logger.info(f"Found conversation containing number: {number}")
-            else:
-                logger.warning(f"No conversation found containing number: {number}")
-            return conversation
-        except Exception as e:
-            logger.error(f"Error retrieving conversation by number {number} from MongoDB: {e}")
-            raise
+        conversation = self.conversations.find_one({'participant_numbers': number}, projection)
+        if conversation:
+            logger.info("Found conversation containing number: %s", number)
+        else:
+            logger.warning("No conversation found containing number: %s", number)
+        return conversation
 
-    def find_active_conversations_by_interviewer(self, interviewer_number: str) -> List[Dict[str, Any]]:
+    @_mongo_op("retrieving active conversations for interviewer from MongoDB", key=None)
+    def find_active_conversations_by_interviewer(self, interviewer_number: str,
+                                                 projection: Optional[Dict[str, Any]] = _ACTIVE_CONVERSATION_PROJECTION) -> List[Dict[str, Any]]:
         """
         Finds all active conversations for a given interviewer number.
         Active conversations are those with status 'active'.
         
         Args:
             interviewer_number (str): The interviewer's phone number.
+            projection (Optional[Dict[str, Any]], optional): Fields to return. Defaults to the conversation's id, status and participant numbers; pass None for full documents.
         
         Returns:
             List[Dict[str, Any]]: A list of active conversation documents.
         """
-        try:
-            conversations = list(self.conversations.find({
-                'interviewer.number': interviewer_number,
-                'status': 'active'
-            }))
-            logger.info(f"Found {len(conversations)} active conversations for interviewer {interviewer_number}.")
-            return conversations
-        except Exception as e:
-            logger.error(f"Error retrieving active conversations for interviewer {interviewer_number} from MongoDB: {e}")
-            raise
+        conversations = list(self.conversations.find({
+            'interviewer.number': interviewer_number,
+            'status': 'active'
+        }, projection))
+        logger.info("Found %s active conversations for interviewer %s.", len(conversations), interviewer_number)
+        return conversations
 
-    def find_conversations_by_number(self, number: str) -> List[Dict[str, Any]]:
+    @_mongo_op("retrieving conversations by number from MongoDB", key=None)
+    def find_conversations_by_number(self, number: str, projection: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Finds all conversations that involve the given phone number, either as an interviewer or interviewee.
         
         Args:
             number (str): The phone number to search for.
+            projection (Optional[Dict[str, Any]], optional): Fields to return. Defaults to None (all fields).
         
         Returns:
             List[Dict[str, Any]]: A list of conversation documents.
         """
-        try:
-            conversations = list(self.conversations.find({
-                '$or': [
-                    {'interviewer.number': number},
-                    {'interviewees.number': number}
-                ]
-            }))
-            if conversations:
-                logger.info(f"Found {len(conversations)} conversations containing number: {number}")
-            else:
-                logger.warning(f"No conversations found containing number: {number}")
-            return conversations
-        except Exception as e:
-            logger.error(f"Error retrieving conversations by number {number} from MongoDB: {e}")
-            raise
+        conversations = list(self.conversations.find({'participant_numbers': number}, projection))
+        if conversations:
+            logger.info("Found %s conversations containing number: %s", len(conversations), number)
+        else:
+            logger.warning("No conversations found containing number: %s", number)
+        return conversations
 
     # ------------------ Attention Flag Methods ------------------
 
+    @_mongo_op("inserting attention flag into MongoDB", key=None)
     def create_attention_flag(self, flag_entry: Dict[str, Any]) -> None:
         """
         Inserts a new attention flag document into the database.
@@ -235,62 +577,90 @@ class MongoDBHandler:
         Args:
             flag_entry (Dict[str, Any]): The attention flag data to insert.
         """
-        try:
-            self.attention_flags.insert_one(flag_entry)
-            logger.info(f"Attention flag {flag_entry['id']} for conversation {flag_entry['conversation_id']} inserted into MongoDB.")
-        except Exception as e:
-            logger.error(f"Error inserting attention flag into MongoDB: {e}")
-            raise
+        self.attention_flags.insert_one(flag_entry)
+        logger.info("Attention flag %s for conversation %s inserted into MongoDB.", flag_entry['id'], flag_entry['conversation_id'])
 
-    def get_attention_flags(self, conversation_id: Optional[str] = None, resolved: Optional[bool] = None) -> List[Dict[str, Any]]:
+    @_mongo_op("inserting attention flags into MongoDB", key=None)
+    def create_attention_flags(self, flag_entries: List[Dict[str, Any]]) -> None:
+        """
+        Inserts several attention flag documents in a single unordered write.
+        
+        Args:
+            flag_entries (List[Dict[str, Any]]): The attention flag data to insert.
+        """
+        if not flag_entries:
+            return
+        self.attention_flags.insert_many(flag_entries, ordered=False)
+        logger.info("Inserted %s attention flags into MongoDB.", len(flag_entries))
+
+    def get_attention_flags(self, conversation_id: Optional[str] = None, resolved: Optional[bool] = None,
+                            projection: Optional[Dict[str, Any]] = _FLAG_PROJECTION) -> List[Dict[str, Any]]:
         """
         Retrieves attention flag documents, optionally filtered by conversation_id and resolved status.
         
         Args:
             conversation_id (Optional[str], optional): The conversation ID to filter by. Defaults to None.
             resolved (Optional[bool], optional): The resolved status to filter by. Defaults to None.
+            projection (Optional[Dict[str, Any]], optional): Fields to return. Defaults to every field but the ObjectId, so the flags serialize as JSON; pass None for full documents.
         
         Returns:
             List[Dict[str, Any]]: A list of attention flag documents.
         """
-        try:
-            query = {}
-            if conversation_id:
-                query['conversation_id'] = conversation_id
-            if resolved is not None:
-                query['resolved'] = resolved
-            flags = list(self.attention_flags.find(query))
-            logger.info(f"Retrieved {len(flags)} attention flags from MongoDB with query: {query}.")
-            return flags
-        except Exception as e:
-            logger.error(f"Error retrieving attention flags from MongoDB: {e}")
-            raise
+        return list(self.iter_attention_flags(conversation_id=conversation_id, resolved=resolved, projection=projection))
+
+    @_mongo_op("retrieving attention flags from MongoDB")
+    def iter_attention_flags(self, conversation_id: Optional[str] = None, resolved: Optional[bool] = None,
+                             projection: Optional[Dict[str, Any]] = _FLAG_PROJECTION,
+                             batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Dict[str, Any]]:
+        """
+        Yields attention flag documents, optionally filtered by conversation_id and resolved status,
+        streamed from the cursor in batches.
+        
+        Args:
+            conversation_id (Optional[str], optional): The conversation ID to filter by. Defaults to None.
+            resolved (Optional[bool], optional): The resolved status to filter by. Defaults to None.
+            projection (Optional[Dict[str, Any]], optional): Fields to return. Defaults to every field but the ObjectId.
+            batch_size (int, optional): Number of documents fetched per round trip. Defaults to DEFAULT_BATCH_SIZE.
+        
+        Yields:
+            Dict[str, Any]: An attention flag document.
+        """
+        query = {}
+        if conversation_id:
+            query['conversation_id'] = conversation_id
+        if resolved is not None:
+            query['resolved'] = resolved
+        count = 0
+        for flag in self.attention_flags.find(query, projection).batch_size(batch_size):
+            count += 1
+            yield flag
+        logger.info("Retrieved %s attention flags from MongoDB with query: %s.", count, query)
 
-    def resolve_attention_flag(self, flag_id: str) -> bool:
+    @_mongo_op("resolving attention flag in MongoDB", key='flag_id')
+    def resolve_attention_flag(self, flag_id: str) -> Optional[Dict[str, Any]]:
         """
-        Marks an attention flag as resolved.
+        Marks an attention flag as resolved and returns the resolved flag from the same
+        command. Only unresolved flags match, so resolving twice is a no-op.
         
         Args:
             flag_id (str): The unique identifier of the attention flag.
         
         Returns:
-            bool: True if the flag was successfully resolved, False otherwise.
-        """
-        try:
-            result = self.attention_flags.update_one(
-                {'id': flag_id},
-                {'$set': {'resolved': True, 'resolved_at': datetime.now(pytz.UTC).isoformat()}}
-            )
-            if result.modified_count > 0:
-                logger.info(f"Attention flag {flag_id} marked as resolved in MongoDB.")
-                return True
-            else:
-                logger.warning(f"Attention flag {flag_id} not found or already resolved in MongoDB.")
-                return False
-        except Exception as e:
-            logger.error(f"Error resolving attention flag {flag_id} in MongoDB: {e}")
-            raise
+            Optional[Dict[str, Any]]: The resolved flag document, or None if it was not found or already resolved.
+        """
+        flag = self.attention_flags.find_one_and_update(
+            {'id': flag_id, 'resolved': False},
+            {'$set': {'resolved': True, 'resolved_at': datetime.now(timezone.utc).isoformat()}},
+            projection=_FLAG_PROJECTION,
+            return_document=ReturnDocument.AFTER
+        )
+        if flag:
+            logger.info("Attention flag %s marked as resolved in MongoDB.", flag_id)
+        else:
+            logger.warning("Attention flag %s not found or already resolved in MongoDB.", flag_id)
+        return flag
 
+    @_mongo_op("retrieving attention flags for conversation")
     def get_attention_flags_by_conversation(self, conversation_id: str) -> List[Dict[str, Any]]:
         """
         Retrieves all unresolved attention flags for a specific conversation.
@@ -301,51 +671,32 @@ class MongoDBHandler:
         Returns:
             List[Dict[str, Any]]: A list of attention flag documents.
         """
-        try:
-            flags = self.get_attention_flags(conversation_id=conversation_id, resolved=False)
-            logger.info(f"Retrieved {len(flags)} unresolved attention flags for conversation {conversation_id}.")
-            return flags
-        except Exception as e:
-            logger.error(f"Error retrieving attention flags for conversation {conversation_id}: {e}")
-            raise
+        flags = self.get_attention_flags(conversation_id=conversation_id, resolved=False)
+        logger.info("Retrieved %s unresolved attention flags for conversation %s.", len(flags), conversation_id)
+        return flags
 
     # ------------------ Additional Utility Methods ------------------
 
-    def find_completed_conversations(self) -> List[Dict[str, Any]]:
+    def find_completed_conversations(self, projection: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Retrieves all conversations marked as 'completed'.
         
+        Args:
+            projection (Optional[Dict[str, Any]], optional): Fields to return. Defaults to None (all fields).
+        
         Returns:
             List[Dict[str, Any]]: A list of completed conversation documents.
         """
-        try:
-            conversations = list(self.conversations.find({'status': 'completed'}))
-            logger.info(f"Retrieved {len(conversations)} completed conversations from MongoDB.")
-            return conversations
-        except Exception as e:
-            logger.error(f"Error retrieving completed conversations from MongoDB: {e}")
-            raise
+        return list(self.iter_conversations(status='completed', projection=projection))
 
+    @_mongo_op("retrieving all attention flags", key=None, reraise=False, default=list)
     def get_all_attention_flags(self) -> List[Dict[str, Any]]:
-        try:
-            flags = list(self.attention_flags.find({"resolved": False}))
-            # Convert ObjectId to string if necessary
-            for flag in flags:
-                flag['_id'] = str(flag['_id'])
-            return flags
-        except Exception as e:
-            logger.error(f"Error retrieving all attention flags: {str(e)}")
-            return []
-        
+        # The server stringifies the ObjectId, so the documents need no Python pass
+        return list(self.attention_flags.aggregate(_UNRESOLVED_FLAGS_PIPELINE, batchSize=DEFAULT_BATCH_SIZE))
+
+    @_mongo_op("retrieving completed conversations", key=None, reraise=False, default=list)
     def get_completed_conversations(self) -> List[Dict[str, Any]]:
-        try:
-            conversations = list(self.conversations.find({"status": "completed"}))
-            for convo in conversations:
-                convo['_id'] = str(convo['_id'])
-            return conversations
-        except Exception as e:
-            logger.error(f"Error retrieving completed conversations: {str(e)}")
-            return []
+        return list(self.conversations.aggregate(_COMPLETED_CONVERSATIONS_PIPELINE, batchSize=DEFAULT_BATCH_SIZE))
 
     # ------------------ Example of Comprehensive Conversation Handling ------------------
 
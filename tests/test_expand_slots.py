@@ -0,0 +1,40 @@
+import os
+import unittest
+
+os.environ.setdefault("GOOGLE_API_KEY", "test-key")
+
+from chatbot.utils import expand_slots, MAX_EXPANDED_SLOTS
+
+class TestExpandSlots(unittest.TestCase):
+    def test_range_is_split_with_gap(self):
+        slots = [{'start_time': '2030-01-07T09:00:00', 'end_time': '2030-01-07T11:00:00', 'gap_minutes': 15}]
+        expanded = expand_slots(slots, 30)
+        self.assertEqual([slot['start_time'] for slot in expanded], [
+            '2030-01-07T09:00:00', '2030-01-07T09:45:00', '2030-01-07T10:30:00'
+        ])
+
+    def test_negative_gap_is_treated_as_zero(self):
+        # A gap at least as negative as the duration used to loop forever
+        slots = [{'start_time': '2030-01-07T09:00:00', 'end_time': '2030-01-07T10:00:00', 'gap_minutes': -30}]
+        expanded = expand_slots(slots, 30)
+        self.assertEqual([slot['start_time'] for slot in expanded], ['2030-01-07T09:00:00', '2030-01-07T09:30:00'])
+
+    def test_expansion_is_capped(self):
+        slots = [{'start_time': '2030-01-01T00:00:00', 'end_time': '2030-12-31T00:00:00'}]
+        self.assertEqual(len(expand_slots(slots, 1)), MAX_EXPANDED_SLOTS)
+        self.assertEqual(len(expand_slots(slots, 1, max_slots=3)), 3)
+
+    def test_short_and_unusable_slots_are_kept(self):
+        slots = [
+            {'start_time': '2030-01-07T09:00:00', 'end_time': '2030-01-07T09:30:00'},
+            {'start_time': '2030-01-07T12:00:00', 'end_time': 'unspecified'}
+        ]
+        self.assertEqual(len(expand_slots(slots, 60)), 2)
+
+    def test_invalid_duration_leaves_slots_unchanged(self):
+        slots = [{'start_time': '2030-01-07T09:00:00', 'end_time': '2030-01-07T12:00:00'}]
+        self.assertEqual(expand_slots(slots, 0), slots)
+        self.assertEqual(expand_slots(slots, 'unknown'), slots)
+
+if __name__ == "__main__":
+    unittest.main()
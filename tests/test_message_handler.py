@@ -0,0 +1,236 @@
+import copy
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+os.environ.setdefault("GOOGLE_API_KEY", "test-key")
+
+from chatbot.message_handler import MessageHandler
+from chatbot.constants import ConversationState
+
+SLOT_A = {'start_time': '2030-01-07T10:00:00+00:00', 'end_time': '2030-01-07T11:00:00+00:00'}
+SLOT_B = {'start_time': '2030-01-07T12:00:00+00:00', 'end_time': '2030-01-07T13:00:00+00:00'}
+
+class InMemoryConversations:
+    """
+    Stands in for MongoDBHandler with one stored conversation. Reads return copies and
+    reserve_slots applies the same guard as the real one, so a handler holding a stale copy
+    runs into the reservations another request made in the meantime.
+    """
+    def __init__(self, conversation):
+        self.conversation = copy.deepcopy(conversation)
+
+    def get_conversation(self, conversation_id, projection=None, cached=False):
+        return copy.deepcopy(self.conversation)
+
+    def _interviewee(self, number):
+        return next(ie for ie in self.conversation['interviewees'] if ie['number'] == number)
+
+    def reserve_slots(self, conversation_id, slots, update_data=None, interviewee_fields=None):
+        reserved = {slot['start_time'] for slot in self.conversation['reserved_slots']}
+        if any(slot['start_time'] in reserved for slot in slots):
+            return False
+        self.conversation['reserved_slots'].extend(copy.deepcopy(slots))
+        self.conversation.update(update_data or {})
+        for number, fields in (interviewee_fields or {}).items():
+            self._interviewee(number).update(copy.deepcopy(fields))
+        return True
+
+    def update_interviewee(self, conversation_id, number, fields, update_data=None, increments=None,
+                           expected=None, filter_data=None, pulls=None):
+        self._interviewee(number).update(copy.deepcopy(fields))
+        self.conversation.update(copy.deepcopy(update_data or {}))
+        for field, condition in (pulls or {}).items():
+            self.conversation[field] = [
+                slot for slot in self.conversation[field] if slot['start_time'] != condition['start_time']
+            ]
+        return True
+
+    def update_interviewees(self, conversation_id, numbers, fields):
+        for number in numbers:
+            self._interviewee(number).update(copy.deepcopy(fields))
+
+def make_handler(mongodb_handler=None):
+    # The LLM client is patched out; the scheduler and sends are mocked
+    scheduler = MagicMock()
+    if mongodb_handler is not None:
+        scheduler.mongodb_handler = mongodb_handler
+    with patch('chatbot.message_handler.LLMModel'):
+        handler = MessageHandler(scheduler)
+    handler.send_message = MagicMock(return_value=True)
+    return handler
+
+def make_conversation(*interviewees, reserved_slots=()):
+    return {
+        'conversation_id': 'conv1',
+        'status': 'active',
+        'available_slots': [dict(SLOT_A), dict(SLOT_B)],
+        'reserved_slots': [dict(slot) for slot in reserved_slots],
+        'slot_denials': {},
+        'interviewer': {'name': 'Alice', 'number': '+111', 'role': 'interviewer'},
+        'interviewees': [{
+            'name': name,
+            'number': number,
+            'state': state,
+            'offered_slots': [],
+            'proposed_slot': None,
+            'conversation_history': []
+        } for name, number, state in interviewees]
+    }
+
+class TestConcurrentSlotReservation(unittest.TestCase):
+    def setUp(self):
+        # The handler read the conversation before another request reserved SLOT_A
+        self.stale = make_conversation(('Bob', '+222', ConversationState.AWAITING_AVAILABILITY.value))
+        self.store = InMemoryConversations(self.stale)
+        self.store.conversation['reserved_slots'].append(dict(SLOT_A))
+        self.handler = make_handler(self.store)
+
+    def test_slot_taken_concurrently_is_skipped_for_the_next_one(self):
+        self.handler.process_scheduling_for_interviewee('conv1', '+222', conversation=self.stale)
+
+        bob = self.store._interviewee('+222')
+        self.assertEqual(bob['proposed_slot'], SLOT_B)
+        self.assertEqual(bob['state'], ConversationState.CONFIRMATION_PENDING.value)
+        self.assertEqual(self.store.conversation['reserved_slots'], [SLOT_A, SLOT_B])
+        self.handler.send_message.assert_called_once()
+
+    def test_no_free_slot_left_marks_the_interviewee_without_touching_reservations(self):
+        self.store.conversation['reserved_slots'].append(dict(SLOT_B))
+        self.handler.process_remaining_interviewees = MagicMock()
+
+        self.handler.process_scheduling_for_interviewee('conv1', '+222', conversation=self.stale)
+
+        bob = self.store._interviewee('+222')
+        self.assertEqual(bob['state'], ConversationState.NO_SLOTS_AVAILABLE.value)
+        self.assertEqual(bob['offered_slots'], [])
+        self.assertEqual(self.store.conversation['reserved_slots'], [SLOT_A, SLOT_B])
+        self.handler.send_message.assert_not_called()
+
+class TestSlotRelease(unittest.TestCase):
+    def setUp(self):
+        # Bob holds SLOT_A; Carol reserved SLOT_B after the handler read the conversation
+        self.stale = make_conversation(
+            ('Bob', '+222', ConversationState.CONFIRMATION_PENDING.value),
+            ('Carol', '+333', ConversationState.AWAITING_AVAILABILITY.value),
+            reserved_slots=[SLOT_A]
+        )
+        self.stale['interviewees'][0].update({'proposed_slot': dict(SLOT_A), 'offered_slots': [dict(SLOT_A)]})
+        self.store = InMemoryConversations(self.stale)
+        self.store.conversation['reserved_slots'].append(dict(SLOT_B))
+        self.handler = make_handler(self.store)
+        self.handler.process_remaining_interviewees = MagicMock()
+
+    def test_accepting_pulls_only_the_accepted_slot(self):
+        bob = self.stale['interviewees'][0]
+
+        self.handler._handle_slot_acceptance('conv1', bob, self.stale)
+
+        self.assertEqual(self.store.conversation['reserved_slots'], [SLOT_B])
+        self.assertEqual(self.store.conversation['available_slots'], [SLOT_B])
+        self.assertEqual(self.store._interviewee('+222')['state'], ConversationState.SCHEDULED.value)
+
+    @patch('chatbot.message_handler.extract_slots_and_timezone', return_value={})
+    def test_denying_pulls_only_the_denied_slot(self, _):
+        bob = self.stale['interviewees'][0]
+
+        self.handler._handle_slot_denial('conv1', bob, self.stale, "That doesn't work")
+
+        self.assertEqual(self.store.conversation['reserved_slots'], [SLOT_B])
+        self.assertEqual(self.store.conversation['available_slots'], [SLOT_A, SLOT_B])
+        self.assertEqual(self.store.conversation['slot_denials'], {SLOT_A['start_time']: ['+222']})
+
+class TestSlotReservationFallback(unittest.TestCase):
+    def setUp(self):
+        # The handler read the conversation before Dave reserved SLOT_A
+        self.stale = make_conversation(
+            ('Bob', '+222', ConversationState.AWAITING_AVAILABILITY.value),
+            ('Carol', '+333', ConversationState.AWAITING_AVAILABILITY.value)
+        )
+        self.stale['interviewees'][0]['conversation_history'] = ['stale history']
+        self.store = InMemoryConversations(self.stale)
+        self.store.conversation['reserved_slots'].append(dict(SLOT_A))
+        self.handler = make_handler(self.store)
+        self.handler.process_remaining_interviewees = MagicMock()
+
+    def schedule_both(self):
+        self.handler.process_scheduling_for_interviewees(
+            'conv1', ['+222', '+333'], conversation=self.stale,
+            pending_fields={'+222': {'timezone': 'Europe/London'}}
+        )
+
+    def test_failed_reservation_leaves_the_callers_copy_untouched(self):
+        self.schedule_both()
+
+        self.assertEqual(self.stale['reserved_slots'], [])
+        for interviewee in self.stale['interviewees']:
+            self.assertEqual(interviewee['state'], ConversationState.AWAITING_AVAILABILITY.value)
+            self.assertIsNone(interviewee['proposed_slot'])
+            self.assertEqual(interviewee['offered_slots'], [])
+
+    def test_fallback_hands_out_the_remaining_slot_and_follows_up_once(self):
+        self.schedule_both()
+
+        bob, carol = self.store.conversation['interviewees']
+        proposed = [ie for ie in (bob, carol) if ie['state'] == ConversationState.CONFIRMATION_PENDING.value]
+        exhausted = [ie for ie in (bob, carol) if ie['state'] == ConversationState.NO_SLOTS_AVAILABLE.value]
+        self.assertEqual(len(proposed), 1)
+        self.assertEqual(len(exhausted), 1)
+        self.assertEqual(proposed[0]['proposed_slot'], SLOT_B)
+        self.assertEqual(self.store.conversation['reserved_slots'], [SLOT_A, SLOT_B])
+        self.assertEqual(bob['timezone'], 'Europe/London')
+        self.assertEqual(bob['conversation_history'], ['stale history'])
+        self.handler.process_remaining_interviewees.assert_called_once_with('conv1')
+
+    def test_successful_reservation_is_mirrored_in_the_callers_copy(self):
+        self.store.conversation['reserved_slots'] = []
+
+        self.schedule_both()
+
+        self.assertCountEqual(self.stale['reserved_slots'], [SLOT_A, SLOT_B])
+        for interviewee in self.stale['interviewees']:
+            self.assertEqual(interviewee['state'], ConversationState.CONFIRMATION_PENDING.value)
+            self.assertEqual(interviewee['offered_slots'], [interviewee['proposed_slot']])
+        self.assertEqual(self.store.conversation['interviewees'], self.stale['interviewees'])
+        self.handler.process_remaining_interviewees.assert_not_called()
+
+class TestFailedEventDeletion(unittest.TestCase):
+    def setUp(self):
+        self.handler = make_handler()
+        self.mongodb_handler = self.handler.scheduler.mongodb_handler
+        self.mongodb_handler.get_conversation.return_value = {
+            'conversation_id': 'conv1',
+            'interviewer': {'name': 'Alice', 'number': '+111'},
+            'interviewees': []
+        }
+
+    def test_restore_is_conditional_on_the_cancellation_still_standing(self):
+        self.mongodb_handler.update_interviewee.return_value = True
+
+        self.handler._handle_failed_event_deletion('conv1', '+222', 'Bob', 'event1')
+
+        args, kwargs = self.mongodb_handler.update_interviewee.call_args
+        self.assertEqual(args[:3], ('conv1', '+222', {'event_id': 'event1', 'state': ConversationState.SCHEDULED.value}))
+        self.assertEqual(kwargs['expected'], {'state': ConversationState.CANCELLED.value, 'event_id': None})
+        self.assertEqual(kwargs['filter_data'], {'status': {'$ne': 'completed'}})
+
+    def test_restored_meeting_is_reported_to_both_participants(self):
+        self.mongodb_handler.update_interviewee.return_value = True
+
+        self.handler._handle_failed_event_deletion('conv1', '+222', 'Bob', 'event1')
+
+        recipients = [call_args[0][0] for call_args in self.handler.send_message.call_args_list]
+        self.assertEqual(sorted(recipients), ['+111', '+222'])
+        self.mongodb_handler.create_attention_flag.assert_called_once()
+
+    def test_superseded_cancellation_is_not_restored_or_announced(self):
+        self.mongodb_handler.update_interviewee.return_value = False
+
+        self.handler._handle_failed_event_deletion('conv1', '+222', 'Bob', 'event1')
+
+        self.handler.send_message.assert_not_called()
+        flag = self.mongodb_handler.create_attention_flag.call_args[1]['flag_data']
+        self.assertIn('removed by hand', flag['description'])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+import unittest
+from unittest.mock import MagicMock
+
+from store.mongodb_handler import MongoDBHandler
+
+class TestResolveAttentionFlag(unittest.TestCase):
+    def setUp(self):
+        # Skip __init__, which connects and creates indexes; the collection is mocked
+        self.handler = MongoDBHandler.__new__(MongoDBHandler)
+        self.handler.attention_flags = MagicMock()
+
+    def test_resolving_returns_the_resolved_flag(self):
+        resolved = {'id': 'flag1', 'resolved': True}
+        self.handler.attention_flags.find_one_and_update.return_value = resolved
+        self.assertEqual(self.handler.resolve_attention_flag('flag1'), resolved)
+
+    def test_already_resolved_flag_is_not_matched(self):
+        # The filter only matches unresolved flags, so a second resolve finds nothing
+        self.handler.attention_flags.find_one_and_update.return_value = None
+
+        self.assertIsNone(self.handler.resolve_attention_flag('flag1'))
+
+        query = self.handler.attention_flags.find_one_and_update.call_args[0][0]
+        self.assertEqual(query, {'id': 'flag1', 'resolved': False})
+
+if __name__ == "__main__":
+    unittest.main()